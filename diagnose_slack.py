@@ -192,7 +192,7 @@ async def test_minimal_bot():
             logger.error("=== DISPATCH ERROR DETECTED ===")
             logger.error(f"Error: {error}")
             logger.error(f"Error type: {type(error)}")
-            logger.error(f"Request body: {json.dumps(body, indent=2, default=str)}")
+            logger.error(f"Request body: {json.dumps(body, separators=(',', ':'), default=str)}")
             logger.error("=== END DISPATCH ERROR ===")
 
         # Create handler
@@ -90,7 +90,7 @@ def process_job_sync(url):
     try:
         logger.info(f"Processing job URL (sync): {url}")
 
-        # Fetch job text - returns (text, soup) tuple
+        # Fetch job text - returns (text, page_data) tuple
         job_text_result = fetch_job_text(url)
 
         if not job_text_result:
@@ -378,7 +378,7 @@ async def handle_addjob_command(ack, command, respond):
 async def global_error_handler(error, body, logger_param):
     """Global error handler"""
     logger.error(f"Global error: {error}")
-    logger.error(f"Request: {json.dumps(body, indent=2, default=str)}")
+    logger.error(f"Request: {json.dumps(body, separators=(',', ':'), default=str)}")
 
 async def main():
     """Start the async-safe Slack bot"""
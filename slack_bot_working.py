@@ -213,7 +213,7 @@ async def process_job_url(url, say):
 
         # Use the proven working functions from jobbot_cli
         # These functions are synchronous and work perfectly
-        # fetch_job_text returns (text, soup) tuple
+        # fetch_job_text returns (text, page_data) tuple
         job_text_result = fetch_job_text(url)
 
         if not job_text_result:
@@ -368,7 +368,7 @@ async def global_error_handler(error, body, logger_param):
     logger.error("=== GLOBAL ERROR HANDLER ===")
     logger.error(f"Error: {error}")
     logger.error(f"Error type: {type(error)}")
-    logger.error(f"Body: {json.dumps(body, indent=2, default=str)}")
+    logger.error(f"Body: {json.dumps(body, separators=(',', ':'), default=str)}")
     logger.error("=== END GLOBAL ERROR ===")
 
 async def main():
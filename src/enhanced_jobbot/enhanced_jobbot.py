@@ -230,32 +230,39 @@ def split_text_for_notion(text, max_chars=1990):
     if len(text) <= max_chars:
         return [text]
 
+    # Walk the text by index rather than re-slicing the remainder each pass
     chunks = []
-    remaining = text
+    start = 0
+    end = len(text.rstrip())
 
-    while len(remaining) > max_chars:
+    while end - start > max_chars:
+        limit = start + max_chars
         # Find a good break point (prefer sentence or paragraph breaks)
-        break_point = max_chars
+        break_point = limit
 
-        # Look for sentence endings within the last 100 characters
-        for i in range(max_chars - 100, max_chars):
-            if i < len(remaining) and remaining[i] in '.!?\n':
+        # Look for sentence endings within the last 100 characters (never
+        # before start, so each chunk advances even for small max_chars)
+        for i in range(max(start, limit - 100), limit):
+            if text[i] in '.!?\n':
                 break_point = i + 1
                 break
 
         # If no good break point, look for word boundaries
-        if break_point == max_chars:
-            for i in range(max_chars - 20, max_chars):
-                if i < len(remaining) and remaining[i] == ' ':
+        if break_point == limit:
+            for i in range(max(start + 1, limit - 20), limit):
+                if text[i] == ' ':
                     break_point = i
                     break
 
-        chunk = remaining[:break_point].strip()
-        chunks.append(chunk)
-        remaining = remaining[break_point:].strip()
+        chunks.append(text[start:break_point].strip())
 
-    if remaining:
-        chunks.append(remaining)
+        # Skip the whitespace the next chunk would otherwise start with
+        start = break_point
+        while start < end and text[start].isspace():
+            start += 1
+
+    if start < end:
+        chunks.append(text[start:end])
 
     return chunks
 
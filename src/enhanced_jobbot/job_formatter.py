@@ -38,7 +38,8 @@ class JobDescriptionFormatter:
     def format_for_notion(self,
                           content: str,
                           soup: Optional[BeautifulSoup] = None,
-                          summary: Optional[str] = None) -> Dict[str, Any]:
+                          summary: Optional[str] = None,
+                          structure: Optional[List[Tuple[str, Any]]] = None) -> Dict[str, Any]:
         """
         Format job description for Notion with perfect structure preservation
 
@@ -46,6 +47,7 @@ class JobDescriptionFormatter:
             content: Plain text job description
             soup: Optional BeautifulSoup parsed HTML
             summary: Optional job summary to prepend
+            structure: Optional pre-extracted HTML structure (see extract_html_structure)
 
         Returns:
             Dictionary with formatted content for different Notion field types
@@ -60,8 +62,10 @@ class JobDescriptionFormatter:
         }
 
         # Process HTML if available for better structure
-        if soup:
-            structured_content = self._parse_html_structure(soup)
+        if structure is None and soup:
+            structure = extract_html_structure(soup)
+        if structure:
+            structured_content = self._parse_html_structure(structure)
             if structured_content['has_structure']:
                 result.update(structured_content)
 
@@ -78,58 +82,49 @@ class JobDescriptionFormatter:
 
         return result
 
-    def _parse_html_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract structured content from HTML"""
+    def _parse_html_structure(self, structure: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        """Build structured content from pre-extracted HTML elements"""
         blocks = []
         sections = {}
         bullets = []
         current_section = 'Main'
         has_structure = False
 
-        for element in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'li', 'div', 'span']):
-            # Skip empty elements
-            text = element.get_text(strip=True)
-            if not text:
-                continue
-
+        for kind, value in structure:
             # Handle headers
-            if element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            if kind == 'heading':
+                level, text = value
                 has_structure = True
                 current_section = text
                 sections[current_section] = []
-                blocks.append(self._create_heading_block(text, int(element.name[1])))
+                blocks.append(self._create_heading_block(text, level))
 
             # Handle lists
-            elif element.name in ['ul', 'ol']:
+            elif kind == 'list':
                 has_structure = True
-                list_items = element.find_all('li', recursive=False)
-                for li in list_items:
-                    li_text = li.get_text(strip=True)
-                    if li_text:
-                        bullets.append(li_text)
-                        sections.setdefault(current_section, []).append(f"• {li_text}")
-                        blocks.append(self._create_bullet_block(li_text))
-
-            # Handle list items not in ul/ol
-            elif element.name == 'li' and element.parent.name not in ['ul', 'ol']:
-                li_text = element.get_text(strip=True)
-                if li_text:
+                for li_text in value:
                     bullets.append(li_text)
                     sections.setdefault(current_section, []).append(f"• {li_text}")
                     blocks.append(self._create_bullet_block(li_text))
 
+            # Handle list items not in ul/ol
+            elif kind == 'item':
+                bullets.append(value)
+                sections.setdefault(current_section, []).append(f"• {value}")
+                blocks.append(self._create_bullet_block(value))
+
             # Handle paragraphs
-            elif element.name == 'p':
+            elif kind == 'paragraph':
                 # Check if it's a bullet-like paragraph
-                if self._is_bullet_line(text):
+                if self._is_bullet_line(value):
                     has_structure = True
-                    clean_text = self._clean_bullet_text(text)
+                    clean_text = self._clean_bullet_text(value)
                     bullets.append(clean_text)
                     sections.setdefault(current_section, []).append(f"• {clean_text}")
                     blocks.append(self._create_bullet_block(clean_text))
                 else:
-                    sections.setdefault(current_section, []).append(text)
-                    blocks.append(self._create_paragraph_block(text))
+                    sections.setdefault(current_section, []).append(value)
+                    blocks.append(self._create_paragraph_block(value))
 
         # Create markdown from sections
         markdown = self._sections_to_markdown(sections)
@@ -380,12 +375,49 @@ class JobDescriptionFormatter:
 
 # Utility functions for external use
 
+def extract_html_structure(soup: BeautifulSoup) -> List[Tuple[str, Any]]:
+    """
+    Pull the headings, lists and paragraphs the formatter needs out of a soup
+
+    Returns a flat list of (kind, value) tuples in document order so callers
+    can drop the parsed tree right after fetching:
+    - ('heading', (level, text))
+    - ('list', [item_text, ...])
+    - ('item', text)  # <li> outside of a <ul>/<ol>
+    - ('paragraph', text)
+    """
+    structure = []
+
+    for element in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'ul', 'ol', 'li']):
+        # Skip empty elements
+        text = element.get_text(strip=True)
+        if not text:
+            continue
+
+        if element.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+            structure.append(('heading', (int(element.name[1]), text)))
+        elif element.name in ['ul', 'ol']:
+            items = [li.get_text(strip=True) for li in element.find_all('li', recursive=False)]
+            structure.append(('list', [item for item in items if item]))
+        elif element.name == 'li':
+            if element.parent.name not in ['ul', 'ol']:
+                structure.append(('item', text))
+        elif element.name == 'p':
+            structure.append(('paragraph', text))
+
+    return structure
+
+
 def format_job_description(content: str,
                           soup: Optional[BeautifulSoup] = None,
-                          summary: Optional[str] = None) -> Dict[str, Any]:
+                          summary: Optional[str] = None,
+                          structure: Optional[List[Tuple[str, Any]]] = None) -> Dict[str, Any]:
     """
     Main entry point for formatting job descriptions
 
+    Pass either the parsed soup or a pre-extracted structure from
+    extract_html_structure (preferred, so the soup can be freed early).
+
     Returns dict with:
     - rich_text: Formatted text for Notion rich text field (2000 char)
     - blocks: List of Notion blocks for page content
@@ -393,7 +425,7 @@ def format_job_description(content: str,
     - bullets: List of extracted bullet points
     """
     formatter = JobDescriptionFormatter()
-    return formatter.format_for_notion(content, soup, summary)
+    return formatter.format_for_notion(content, soup, summary, structure)
 
 
 def extract_key_bullets(content: str, max_bullets: int = 10) -> List[str]:
@@ -13,23 +13,25 @@ import argparse
 import logging
 import json
 import re
+import time
+import random
+import threading
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 import requests
 from bs4 import BeautifulSoup
 from notion_client import Client as NotionClient
-import openai
-from openai import OpenAI
+from notion_client.errors import APIResponseError
+from openai import OpenAI, RateLimitError, APIStatusError, APIConnectionError
 try:
-    from .job_formatter import format_job_description
+    from .job_formatter import format_job_description, extract_html_structure
 except ImportError:
-    from job_formatter import format_job_description
+    from job_formatter import format_job_description, extract_html_structure
 
-# Playwright imports
-try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# Playwright is only probed for here; its sizeable import happens on the
+# first dynamic-page fetch, so callers that never need it don't pay for it
+PLAYWRIGHT_AVAILABLE = find_spec("playwright") is not None
 
 # -----------------------------
 # Logging Setup
@@ -56,9 +58,85 @@ if not all([OPENAI_API_KEY, NOTION_TOKEN, NOTION_DATABASE_ID]):
     print("\nPlease set these in your .env file")
     sys.exit(1)
 
-client = openai.OpenAI(api_key=OPENAI_API_KEY)
+client = OpenAI(api_key=OPENAI_API_KEY)
 notion = NotionClient(auth=NOTION_TOKEN)
 
+# Shared HTTP session: keep-alive connections and compressed responses.
+# Brotli is only advertised when a decoder is installed for urllib3.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': _ACCEPT_ENCODING,
+    'Accept-Language': 'en-US,en;q=0.9',
+})
+
+# -----------------------------
+# API retry / throttling
+# -----------------------------
+MAX_API_ATTEMPTS = 6
+MAX_BACKOFF_SECONDS = 60
+NOTION_MIN_INTERVAL = 0.35  # Notion allows ~3 requests/second per integration
+_last_notion_call = 0.0
+_notion_throttle_lock = threading.Lock()
+
+def _is_retryable(error):
+    """Rate limits and server errors are worth retrying, anything else is not"""
+    if isinstance(error, RateLimitError):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code >= 500
+    if isinstance(error, (APIConnectionError, requests.ConnectionError)):
+        return True
+    if isinstance(error, APIResponseError):
+        return error.status == 429 or error.status >= 500
+    return False
+
+def _with_retry(func, **kwargs):
+    """Call func with exponential backoff and full jitter on retryable errors"""
+    for attempt in range(MAX_API_ATTEMPTS):
+        try:
+            return func(**kwargs)
+        except Exception as e:
+            if attempt == MAX_API_ATTEMPTS - 1 or not _is_retryable(e):
+                raise
+            delay = random.uniform(0, min(MAX_BACKOFF_SECONDS, 2 ** attempt))
+            logging.warning(f"API call failed ({e}), retrying in {delay:.1f}s "
+                            f"(attempt {attempt + 1}/{MAX_API_ATTEMPTS})")
+            time.sleep(delay)
+
+def _throttle_notion():
+    """Space out Notion calls so we stay under the rate limit instead of hitting 429s"""
+    global _last_notion_call
+    with _notion_throttle_lock:
+        wait = NOTION_MIN_INTERVAL - (time.monotonic() - _last_notion_call)
+        if wait > 0:
+            time.sleep(wait)
+        _last_notion_call = time.monotonic()
+
+def _openai_chat(**kwargs):
+    return _with_retry(client.chat.completions.create, **kwargs)
+
+def _notion_call(func, **kwargs):
+    def throttled(**kw):
+        _throttle_notion()
+        return func(**kw)
+    return _with_retry(throttled, **kwargs)
+
+def _notion_pages_create(**kwargs):
+    return _notion_call(notion.pages.create, **kwargs)
+
+def _notion_databases_query(**kwargs):
+    return _notion_call(notion.databases.query, **kwargs)
+
+def _notion_databases_retrieve(**kwargs):
+    return _notion_call(notion.databases.retrieve, **kwargs)
+
 # -----------------------------
 # Helper functions (reused from enhanced_jobbot.py)
 # -----------------------------
@@ -139,6 +217,129 @@ def convert_to_greenhouse_embed(url):
 
     return greenhouse_url
 
+EMPLOYMENT_TYPES = {
+    'FULL_TIME': 'Full time',
+    'PART_TIME': 'Part time',
+    'CONTRACTOR': 'Contract',
+    'TEMPORARY': 'Contract',
+    'INTERN': 'Internship',
+    'PER_DIEM': 'Freelance',
+}
+# Select options of the Commitment property; anything else from JSON-LD is
+# dropped so the OpenAI extraction decides instead
+COMMITMENT_OPTIONS = ('Full time', 'Part time', 'Contract', 'Freelance', 'Internship')
+SALARY_UNITS = {'HOUR': '/hour', 'DAY': '/day', 'WEEK': '/week', 'MONTH': '/month'}
+# Fields a JSON-LD JobPosting must provide for us to skip the OpenAI extraction
+JOB_POSTING_REQUIRED_FIELDS = ('Position', 'Company', 'Commitment', 'Location')
+
+def _find_job_posting(data):
+    """Walk a JSON-LD document (dicts, lists, @graph) for a JobPosting object"""
+    if isinstance(data, list):
+        for item in data:
+            found = _find_job_posting(item)
+            if found:
+                return found
+    elif isinstance(data, dict):
+        types = data.get('@type')
+        if types == 'JobPosting' or (isinstance(types, list) and 'JobPosting' in types):
+            return data
+        if '@graph' in data:
+            return _find_job_posting(data['@graph'])
+    return None
+
+def _format_salary(base_salary):
+    """Turn a schema.org MonetaryAmount into e.g. '$80,000 - $120,000'"""
+    if not isinstance(base_salary, dict):
+        return str(base_salary) if base_salary else ""
+
+    value = base_salary.get('value')
+    currency = base_salary.get('currency', '')
+    symbol = '$' if currency in ('', 'USD') else f"{currency} "
+
+    if isinstance(value, dict):
+        unit = SALARY_UNITS.get(str(value.get('unitText', '')).upper(), '')
+        low, high = value.get('minValue'), value.get('maxValue')
+        amount = value.get('value')
+    else:
+        unit = SALARY_UNITS.get(str(base_salary.get('unitText', '')).upper(), '')
+        low = high = None
+        amount = value
+
+    def fmt(number):
+        try:
+            return f"{symbol}{float(number):,.0f}"
+        except (TypeError, ValueError):
+            return str(number)
+
+    if low and high and low != high:
+        return f"{fmt(low)} - {fmt(high)}{unit}"
+    if low or high or amount:
+        return f"{fmt(low or high or amount)}{unit}"
+    return ""
+
+def _commitment_option(employment_type):
+    """Map a schema.org employmentType onto a Commitment option, or '' if there is none"""
+    value = str(employment_type).strip()
+    mapped = EMPLOYMENT_TYPES.get(value.upper().replace('-', '_').replace(' ', '_'))
+    if mapped:
+        return mapped
+    for option in COMMITMENT_OPTIONS:
+        if value.lower().replace('-', ' ') == option.lower():
+            return option
+    return ''
+
+def extract_job_posting(soup):
+    """Read job fields from an embedded schema.org JobPosting (JSON-LD), if any"""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            posting = _find_job_posting(json.loads(script.string or ""))
+        except (json.JSONDecodeError, TypeError):
+            continue
+        if not posting:
+            continue
+
+        organization = posting.get('hiringOrganization') or {}
+        company = organization.get('name', '') if isinstance(organization, dict) else str(organization)
+
+        employment_types = posting.get('employmentType') or []
+        if not isinstance(employment_types, list):
+            employment_types = [employment_types]
+        commitment = next(
+            (c for c in map(_commitment_option, employment_types) if c), ''
+        )
+
+        locations = []
+        job_locations = posting.get('jobLocation') or []
+        if isinstance(job_locations, dict):
+            job_locations = [job_locations]
+        for job_location in job_locations:
+            address = job_location.get('address') if isinstance(job_location, dict) else None
+            if isinstance(address, dict) and address.get('addressLocality'):
+                locations.append(address['addressLocality'])
+        if posting.get('jobLocationType') == 'TELECOMMUTE':
+            locations.append('Remote')
+
+        industry = posting.get('industry') or []
+        if isinstance(industry, str):
+            industry = [industry]
+
+        return {
+            'Position': str(posting.get('title', '')).strip(),
+            'Company': str(company).strip(),
+            'Salary': _format_salary(posting.get('baseSalary')),
+            'Commitment': commitment,
+            'Industry': industry,
+            'Location': locations,
+        }
+    return None
+
+def extract_page_data(soup):
+    """Pull everything later stages need out of the soup: formatter structure and JSON-LD"""
+    return {
+        'structure': extract_html_structure(soup),
+        'job_posting': extract_job_posting(soup),
+    }
+
 def fetch_job_text_playwright(url):
     """Fetch job text using Playwright for dynamic sites"""
     try:
@@ -149,6 +350,8 @@ def fetch_job_text_playwright(url):
                 logging.info(f"Converting embedded widget URL to direct Greenhouse URL: {converted_url}")
                 url = converted_url
 
+        from playwright.sync_api import sync_playwright
+
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
@@ -253,6 +456,9 @@ def fetch_job_text_playwright(url):
 
             soup = BeautifulSoup(content, 'html.parser')
             text = soup.get_text(separator='\n', strip=True)
+            # Keep only what we need later so the tree can be freed now
+            page_data = extract_page_data(soup)
+            del soup
 
             # Enhanced JavaScript error detection and cleanup
             js_error_phrases = [
@@ -294,7 +500,7 @@ def fetch_job_text_playwright(url):
                     logging.warning("Ashby page missing expected elements, content may be incomplete")
                     # Don't return None here, as content might still be usable
 
-            return text, soup  # Return both text and soup for formatting
+            return text, page_data  # Return both text and page data for formatting
     except Exception as e:
         logging.warning(f"Playwright failed: {e}")
         return None, None
@@ -302,12 +508,11 @@ def fetch_job_text_playwright(url):
 def fetch_job_text_bs(url):
     """Fallback: Fetch job text using requests + BeautifulSoup"""
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _SESSION.get(url, timeout=30)
         response.raise_for_status()
         soup = BeautifulSoup(response.content, 'html.parser')
         text = soup.get_text(separator='\n', strip=True)
-        return text, soup  # Return both text and soup for formatting
+        return text, extract_page_data(soup)  # Return both text and page data for formatting
     except Exception as e:
         logging.error(f"BeautifulSoup failed: {e}")
         return None, None
@@ -315,8 +520,8 @@ def fetch_job_text_bs(url):
 def fetch_job_text(url):
     """Fetch job posting text, try Playwright first, fallback to BeautifulSoup"""
     if PLAYWRIGHT_AVAILABLE:
-        text, soup = fetch_job_text_playwright(url)
-        if text: return text, soup
+        text, page_data = fetch_job_text_playwright(url)
+        if text: return text, page_data
 
     return fetch_job_text_bs(url)
 
@@ -332,7 +537,7 @@ Create a concise 2-3 sentence summary of this job posting that captures:
 Job posting:
 {job_text[:3000]}
 """
-        response = client.chat.completions.create(
+        response = _openai_chat(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             max_tokens=150,
@@ -344,7 +549,15 @@ Job posting:
         return ""
 
 def extract_fields(job_text):
-    """Extract structured fields from job posting using OpenAI"""
+    """Extract structured fields from job posting, using JSON-LD when present and OpenAI otherwise"""
+    # Job text may carry page data (HTML structure, JSON-LD) from the fetch
+    if isinstance(job_text, tuple):
+        text, page_data = job_text
+    else:
+        text, page_data = job_text, None
+    page_data = page_data or {}
+    job_posting = page_data.get('job_posting') or {}
+
     prompt = f"""
 Extract the following fields from this job posting:
 
@@ -373,27 +586,20 @@ Output JSON exactly like this format:
 }}
 
 Job posting:
-{job_text[:8000]}
+{text[:8000]}
 """
 
     text_output = ""
     try:
-        if client:
-            # Use new OpenAI client
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-            )
-            text_output = response.choices[0].message.content
-        else:
-            # Fallback to old OpenAI API
-            response = openai.ChatCompletion.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.2
-            )
-            text_output = response.choices[0].message.content
+        if all(job_posting.get(key) for key in JOB_POSTING_REQUIRED_FIELDS):
+            logging.info("Found schema.org JobPosting data, skipping OpenAI extraction")
+            return _finish_fields(dict(job_posting), text, page_data.get('structure'))
+
+        response = _openai_chat(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": prompt}],
+        )
+        text_output = response.choices[0].message.content
 
         if text_output is None or text_output.strip() == "":
             logging.error("OpenAI returned empty or None response")
@@ -446,41 +652,13 @@ Job posting:
                 logging.error(f"Could not fix JSON: {e2}")
                 logging.error(f"Failed JSON string: '{text_output}'")
                 return create_fallback_fields(job_text)
-        # Store both text and soup for later formatting use
-        if isinstance(job_text, tuple):
-            fields["Full Description"] = job_text[0]
-            fields["HTML_SOUP"] = job_text[1]
-            text_for_summary = job_text[0]
-        else:
-            fields["Full Description"] = job_text
-            fields["HTML_SOUP"] = None
-            text_for_summary = job_text
-        fields["Summary"] = generate_job_summary(text_for_summary)
-
-        # Apply enhanced formatting
-        formatted_result = format_job_description(
-            content=fields["Full Description"],
-            soup=fields.get("HTML_SOUP"),
-            summary=fields.get("Summary")
-        )
-        fields["formatted_description"] = formatted_result['rich_text']
-        fields["notion_blocks"] = formatted_result['blocks']
-        fields["key_bullets"] = formatted_result['bullets']
-
-        # Clean location field to avoid commas in multi-select options
-        if "Location" in fields and isinstance(fields["Location"], list):
-            cleaned_locations = []
-            for location in fields["Location"]:
-                if isinstance(location, str):
-                    parts = [part.strip() for part in location.split(',')]
-                    for part in parts:
-                        if part and part not in cleaned_locations:
-                            cleaned_locations.append(part)
-                else:
-                    cleaned_locations.append(location)
-            fields["Location"] = cleaned_locations
 
-        return fields
+        # Fill anything the model missed from the page's JSON-LD
+        for key, value in job_posting.items():
+            if value and not fields.get(key):
+                fields[key] = value
+
+        return _finish_fields(fields, text, page_data.get('structure'))
 
     except json.JSONDecodeError as e:
         logging.error(f"Failed to parse JSON from OpenAI response: {e}")
@@ -490,19 +668,43 @@ Job posting:
         logging.warning(f"Failed to extract fields from OpenAI: {e}")
         return create_fallback_fields(job_text)
 
+def _finish_fields(fields, text, structure):
+    """Add description, summary, formatting and cleaned locations to extracted fields"""
+    fields["Full Description"] = text
+    fields["Summary"] = generate_job_summary(text)
+
+    # Apply enhanced formatting
+    formatted_result = format_job_description(
+        content=fields["Full Description"],
+        summary=fields.get("Summary"),
+        structure=structure
+    )
+    fields["formatted_description"] = formatted_result['rich_text']
+    fields["notion_blocks"] = formatted_result['blocks']
+    fields["key_bullets"] = formatted_result['bullets']
+
+    # Clean location field to avoid commas in multi-select options
+    if "Location" in fields and isinstance(fields["Location"], list):
+        cleaned_locations = []
+        for location in fields["Location"]:
+            if isinstance(location, str):
+                parts = [part.strip() for part in location.split(',')]
+                for part in parts:
+                    if part and part not in cleaned_locations:
+                        cleaned_locations.append(part)
+            else:
+                cleaned_locations.append(location)
+        fields["Location"] = cleaned_locations
+
+    return fields
+
 def create_fallback_fields(job_text):
     """Create fallback fields when OpenAI extraction fails"""
-    # Handle job_text being a tuple (text, soup) or just text
-    if isinstance(job_text, tuple):
-        text_content = job_text[0]
-        soup_content = job_text[1]
-    else:
-        text_content = job_text
-        soup_content = None
+    # Handle job_text being a tuple (text, page_data) or just text
+    text_content = job_text[0] if isinstance(job_text, tuple) else job_text
 
     return {
         "Full Description": text_content,
-        "HTML_SOUP": soup_content,
         "Summary": generate_job_summary(text_content),
         "Position": "Unknown Position",
         "Company": "",
@@ -517,32 +719,77 @@ def split_text_for_notion(text, max_chars=1990):
     if len(text) <= max_chars:
         return [text]
 
+    # Walk an integer cursor through the text rather than re-slicing the
+    # remainder each time, which copied the rest of the string per chunk
     chunks = []
-    remaining = text
+    start = 0
+    length = len(text)
+
+    while length - start > max_chars:
+        limit = start + max_chars
+        break_point = limit
+
+        # Search windows never reach back to start, so every chunk advances
+        # the cursor even when max_chars is smaller than the window
+        sentence_window = max(start + 1, limit - 100)
+        paragraph_window = max(start + 1, limit - 200)
+
+        # Try to break at sentence end (str.rfind runs in C, no per-char loop)
+        sentence_end = max(
+            text.rfind('. ', sentence_window, limit + 1),
+            text.rfind('! ', sentence_window, limit + 1),
+            text.rfind('? ', sentence_window, limit + 1),
+        )
+        if sentence_end != -1:
+            break_point = sentence_end + 1
+        else:
+            # Try to break at paragraph
+            paragraph_end = text.rfind('\n\n', paragraph_window, limit + 1)
+            if paragraph_end != -1:
+                break_point = paragraph_end
+
+        chunks.append(text[start:break_point].strip())
+
+        # Skip whitespace so the next chunk starts on content
+        start = break_point
+        while start < length and text[start].isspace():
+            start += 1
 
-    while len(remaining) > max_chars:
-        break_point = max_chars
+    if start < length:
+        chunks.append(text[start:].strip())
 
-        # Try to break at sentence end
-        for i in range(max_chars - 100, max_chars):
-            if i < len(remaining) and remaining[i] in '.!?':
-                break_point = i + 1
-                break
+    return chunks
+
+def _text_block(block_type, content):
+    """Build a Notion block of block_type holding a single text run"""
+    return {
+        "object": "block",
+        "type": block_type,
+        block_type: {
+            "rich_text": [{"type": "text", "text": {"content": content[:2000]}}]
+        }
+    }
 
-        # Try to break at paragraph
-        if break_point == max_chars:
-            for i in range(max_chars - 200, max_chars):
-                if i < len(remaining) and remaining[i:i+2] == '\n\n':
-                    break_point = i
-                    break
+def _heading_block(content):
+    return _text_block("heading_2", content)
 
-        chunks.append(remaining[:break_point].strip())
-        remaining = remaining[break_point:].strip()
+def _bullet_block(content):
+    return _text_block("bulleted_list_item", content)
 
-    if remaining:
-        chunks.append(remaining)
+def _paragraph_block(content):
+    return _text_block("paragraph", content)
 
-    return chunks
+MAX_CONTENT_BLOCKS = 50  # Limit blocks to avoid API limits
+
+# Common section headers to detect, compiled into one alternation so each
+# line is scanned once instead of once per header (plain substring match)
+SECTION_HEADERS = [
+    'about', 'overview', 'role', 'position', 'responsibilities', 'requirements',
+    'qualifications', 'skills', 'experience', 'benefits', 'compensation',
+    'what you', 'who you', 'we are looking', 'job description', 'duties',
+    'preferred', 'bonus', 'nice to have', 'location', 'salary'
+]
+SECTION_HEADER_RE = re.compile('|'.join(map(re.escape, SECTION_HEADERS)))
 
 def text_to_notion_blocks(text):
     """Convert plain text to Notion blocks with smart pattern recognition"""
@@ -551,18 +798,13 @@ def text_to_notion_blocks(text):
 
     blocks = []
     lines = text.split('\n')
-
-    # Common section headers to detect
-    section_headers = [
-        'about', 'overview', 'role', 'position', 'responsibilities', 'requirements',
-        'qualifications', 'skills', 'experience', 'benefits', 'compensation',
-        'what you', 'who you', 'we are looking', 'job description', 'duties',
-        'preferred', 'bonus', 'nice to have', 'location', 'salary'
-    ]
+    # Strip and lowercase each line once instead of inside the nested loops
+    stripped = [l.strip() for l in lines]
+    stripped_lower = [l.lower() for l in stripped]
 
     i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    while i < len(lines) and len(blocks) < MAX_CONTENT_BLOCKS:
+        line = stripped[i]
 
         # Skip empty lines
         if not line:
@@ -571,79 +813,93 @@ def text_to_notion_blocks(text):
 
         # Check if this line looks like a section header
         is_header = False
-        line_lower = line.lower()
+        line_lower = stripped_lower[i]
 
         # Detect headers by common patterns
         if (line.endswith(':') and len(line) < 80 and
-            any(header in line_lower for header in section_headers)):
+            SECTION_HEADER_RE.search(line_lower)):
             is_header = True
         elif (line.isupper() and len(line) < 80 and len(line) > 5):
             is_header = True
-        elif (line.startswith('##') or line.startswith('**')):
+        elif line.startswith(('##', '**')):
             is_header = True
             line = line.replace('#', '').replace('*', '').strip()
 
         if is_header:
             # Add as heading
-            blocks.append({
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [{"type": "text", "text": {"content": line[:2000]}}]
-                }
-            })
+            blocks.append(_heading_block(line))
         else:
             # Check if line looks like a bullet point
-            if (line.startswith('•') or line.startswith('-') or line.startswith('*') or
-                re.match(r'^\d+[\.\)]\s', line)):
+            if line.startswith(('•', '-', '*')) or re.match(r'^\d+[\.\)]\s', line):
                 # Remove bullet markers and add as bullet list
                 clean_line = re.sub(r'^[•\-\*\d+\.\)\s]+', '', line).strip()
                 if clean_line:
-                    blocks.append({
-                        "object": "block",
-                        "type": "bulleted_list_item",
-                        "bulleted_list_item": {
-                            "rich_text": [{"type": "text", "text": {"content": clean_line[:2000]}}]
-                        }
-                    })
+                    blocks.append(_bullet_block(clean_line))
             else:
                 # Add as paragraph, but group consecutive lines
                 paragraph_lines = [line]
                 j = i + 1
 
                 # Collect consecutive non-empty, non-header lines
-                while (j < len(lines) and lines[j].strip() and
-                       not any(header in lines[j].lower() for header in section_headers) and
-                       not lines[j].strip().endswith(':') and
-                       not lines[j].startswith(('•', '-', '*')) and
-                       not re.match(r'^\d+[\.\)]\s', lines[j])):
-                    paragraph_lines.append(lines[j].strip())
+                while (j < len(lines) and stripped[j] and
+                       not SECTION_HEADER_RE.search(stripped_lower[j]) and
+                       not stripped[j].endswith(':') and
+                       not stripped[j].startswith(('•', '-', '*')) and
+                       not re.match(r'^\d+[\.\)]\s', stripped[j])):
+                    paragraph_lines.append(stripped[j])
                     j += 1
 
                 # Combine into paragraph
                 paragraph_text = ' '.join(paragraph_lines)
                 if paragraph_text and len(paragraph_text) > 10:  # Skip very short paragraphs
-                    blocks.append({
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {
-                            "rich_text": [{"type": "text", "text": {"content": paragraph_text[:2000]}}]
-                        }
-                    })
+                    blocks.append(_paragraph_block(paragraph_text))
 
                 i = j - 1  # Adjust index since we processed multiple lines
 
         i += 1
 
-    return blocks[:50]  # Limit to 50 blocks to avoid API limits
+    return blocks
+
+# Company page IDs resolved during this process, keyed by normalized name.
+# A lock per name stops concurrent jobs from creating the same company
+# twice without making lookups for different companies wait on each other.
+# Each lock is dropped once no thread holds or waits for it;
+# _company_locks_guard only protects the lock dict and its user counts.
+_company_cache = {}
+_company_locks = {}
+_company_lock_users = {}
+_company_locks_guard = threading.Lock()
 
 def find_or_create_company(company_name):
     """Find existing company or create new one in the linked database"""
     if not company_name or company_name.strip() == "":
         return None
 
+    cache_key = company_name.strip().casefold()
+    if cache_key in _company_cache:
+        logging.info(f"Using cached company: {company_name}")
+        return _company_cache[cache_key]
+
+    with _company_locks_guard:
+        lock = _company_locks.setdefault(cache_key, threading.Lock())
+        _company_lock_users[cache_key] = _company_lock_users.get(cache_key, 0) + 1
+
     try:
-        database_info = notion.databases.retrieve(database_id=NOTION_DATABASE_ID)
+        with lock:
+            if cache_key in _company_cache:
+                return _company_cache[cache_key]
+            return _lookup_or_create_company(company_name, cache_key)
+    finally:
+        with _company_locks_guard:
+            _company_lock_users[cache_key] -= 1
+            if not _company_lock_users[cache_key]:
+                del _company_lock_users[cache_key]
+                del _company_locks[cache_key]
+
+def _lookup_or_create_company(company_name, cache_key):
+    """Query the Company database for company_name, creating it if missing"""
+    try:
+        database_info = _notion_databases_retrieve(database_id=NOTION_DATABASE_ID)
         company_prop = database_info.get('properties', {}).get('Company', {})
 
         if company_prop.get('type') != 'relation':
@@ -656,7 +912,7 @@ def find_or_create_company(company_name):
             return None
 
         # Search for existing company
-        search_results = notion.databases.query(
+        search_results = _notion_databases_query(
             database_id=company_database_id,
             filter={
                 "property": "Name",
@@ -669,10 +925,11 @@ def find_or_create_company(company_name):
         if search_results.get("results"):
             company_id = search_results["results"][0]["id"]
             logging.info(f"Found existing company: {company_name}")
+            _company_cache[cache_key] = company_id
             return company_id
 
         # Create new company
-        new_company = notion.pages.create(
+        new_company = _notion_pages_create(
             parent={"database_id": company_database_id},
             properties={
                 "Name": {"title": [{"text": {"content": company_name.strip()}}]}
@@ -681,6 +938,7 @@ def find_or_create_company(company_name):
 
         company_id = new_company["id"]
         logging.info(f"Created new company: {company_name}")
+        _company_cache[cache_key] = company_id
         return company_id
 
     except Exception as e:
@@ -690,7 +948,7 @@ def find_or_create_company(company_name):
 def check_available_fields():
     """Check what fields are available in the current Notion database"""
     try:
-        database_info = notion.databases.retrieve(database_id=NOTION_DATABASE_ID)
+        database_info = _notion_databases_retrieve(database_id=NOTION_DATABASE_ID)
         properties = database_info.get('properties', {})
 
         available_fields = {
@@ -808,17 +1066,11 @@ def create_notion_page(fields, job_url):
             for i in range(0, len(full_description), max_block_size):
                 chunk = full_description[i:i+max_block_size]
                 if chunk.strip():  # Only add non-empty chunks
-                    toggle_children.append({
-                        "object": "block",
-                        "type": "paragraph",
-                        "paragraph": {
-                            "rich_text": [{"type": "text", "text": {"content": chunk}}]
-                        }
-                    })
+                    toggle_children.append(_paragraph_block(chunk))
             content_blocks[0]["toggle"]["children"] = toggle_children
 
         # Create the page with full job description in content
-        new_page = notion.pages.create(
+        new_page = _notion_pages_create(
             parent={"database_id": NOTION_DATABASE_ID},
             properties=properties,
             children=content_blocks
@@ -830,6 +1082,44 @@ def create_notion_page(fields, job_url):
         logging.error(f"Error creating Notion page: {e}")
         raise
 
+def process_job_url(job_url):
+    """Fetch, extract and create the Notion page for a single job URL"""
+    print(f"🔍 Processing job URL: {job_url}")
+
+    # Fetch job text
+    print(f"📥 Fetching job posting content... ({job_url})")
+    job_result = fetch_job_text(job_url)
+
+    if not job_result or not job_result[0]:
+        raise RuntimeError(f"Failed to fetch job posting content for {job_url}")
+
+    job_text = job_result  # This is now (text, page_data) tuple
+    text_length = len(job_text[0]) if isinstance(job_text, tuple) else len(job_text)
+    print(f"✅ Fetched {text_length} characters ({job_url})")
+
+    # Extract fields
+    print(f"🤖 Extracting job information with AI... ({job_url})")
+    fields = extract_fields(job_text)
+
+    # Display extracted info (single print so concurrent jobs don't interleave)
+    print(
+        f"\n📋 Extracted Information ({job_url}):\n"
+        f"   Position: {fields.get('Position', 'Not found')}\n"
+        f"   Company: {fields.get('Company', 'Not found')}\n"
+        f"   Salary: {fields.get('Salary', 'Not found')}\n"
+        f"   Location: {fields.get('Location', 'Not found')}\n"
+        f"   Commitment: {fields.get('Commitment', 'Not found')}\n"
+        f"   Industry: {fields.get('Industry', 'Not found')}"
+    )
+
+    # Create Notion page
+    print(f"\n📝 Creating Notion page... ({job_url})")
+    new_page = create_notion_page(fields, job_url)
+
+    page_url = new_page.get('url', 'URL not available')
+    print(f"✅ Successfully created Notion page!\n🔗 Page URL: {page_url}")
+    return new_page
+
 def main():
     parser = argparse.ArgumentParser(
         description="JobBot CLI - Extract job information and create Notion pages",
@@ -838,65 +1128,61 @@ def main():
 Examples:
   python jobbot_cli.py "https://example.com/job-posting"
   python jobbot_cli.py --verbose "https://another-job.com"
+  python jobbot_cli.py -j 4 "https://job-one.com" "https://job-two.com"
         """
     )
 
-    parser.add_argument("url", help="Job posting URL to process")
+    parser.add_argument("urls", nargs='+', metavar="url", help="Job posting URL(s) to process")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
+    parser.add_argument("-j", "--jobs", type=int, default=4,
+                        help="Number of URLs to process in parallel (default: 4)")
 
     args = parser.parse_args()
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    job_url = args.url.strip()
+    job_urls = [url.strip() for url in args.urls]
 
-    if not job_url.startswith(('http://', 'https://')):
-        print("❌ Please provide a valid URL starting with http:// or https://")
+    invalid_urls = [url for url in job_urls if not url.startswith(('http://', 'https://'))]
+    if invalid_urls:
+        for url in invalid_urls:
+            print(f"❌ Please provide a valid URL starting with http:// or https://: {url}")
         sys.exit(1)
 
-    try:
-        print(f"🔍 Processing job URL: {job_url}")
-
-        # Fetch job text
-        print("📥 Fetching job posting content...")
-        job_result = fetch_job_text(job_url)
-
-        if not job_result or not job_result[0]:
-            print("❌ Failed to fetch job posting content")
+    if len(job_urls) == 1:
+        try:
+            process_job_url(job_urls[0])
+        except KeyboardInterrupt:
+            print("\n⚠️ Operation cancelled by user")
             sys.exit(1)
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            logging.exception("Full error details:")
+            sys.exit(1)
+        return
 
-        job_text = job_result  # This is now (text, soup) tuple
-        text_length = len(job_text[0]) if isinstance(job_text, tuple) else len(job_text)
-        print(f"✅ Fetched {text_length} characters")
-
-        # Extract fields
-        print("🤖 Extracting job information with AI...")
-        fields = extract_fields(job_text)
-
-        # Display extracted info
-        print("\n📋 Extracted Information:")
-        print(f"   Position: {fields.get('Position', 'Not found')}")
-        print(f"   Company: {fields.get('Company', 'Not found')}")
-        print(f"   Salary: {fields.get('Salary', 'Not found')}")
-        print(f"   Location: {fields.get('Location', 'Not found')}")
-        print(f"   Commitment: {fields.get('Commitment', 'Not found')}")
-        print(f"   Industry: {fields.get('Industry', 'Not found')}")
-
-        # Create Notion page
-        print("\n📝 Creating Notion page...")
-        new_page = create_notion_page(fields, job_url)
-
-        page_url = new_page.get('url', 'URL not available')
-        print(f"✅ Successfully created Notion page!")
-        print(f"🔗 Page URL: {page_url}")
-
+    # Several URLs: fetch, extract and upload them concurrently. Each worker
+    # thread runs its own Playwright instance; OpenAI/Notion calls release the
+    # GIL while waiting on the network.
+    failed = []
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(job_urls)))) as executor:
+            futures = {executor.submit(process_job_url, url): url for url in job_urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Error processing {url}: {e}")
+                    logging.debug("Full error details:", exc_info=True)
+                    failed.append(url)
     except KeyboardInterrupt:
         print("\n⚠️ Operation cancelled by user")
         sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        logging.exception("Full error details:")
+
+    print(f"\n🏁 Processed {len(job_urls) - len(failed)}/{len(job_urls)} job URLs successfully")
+    if failed:
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -21,22 +21,40 @@ import os
 import re
 import json
 import logging
+import time
+import random
 import asyncio
+import queue
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Dict, Any, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from slack_bolt.async_app import AsyncApp
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from dotenv import load_dotenv
+import httpx
+from openai import AsyncOpenAI, RateLimitError, APIStatusError, APIConnectionError
+from notion_client import AsyncClient as AsyncNotionClient
+from notion_client.errors import APIResponseError, RequestTimeoutError
 
 # Import our existing JobBot functionality
 import sys
 sys.path.append(os.path.dirname(__file__))
 from slack_bot_fixed import (
-    fetch_job_text,
-    extract_fields_robust as extract_fields,
-    create_notion_page_robust as create_notion_page,
-    find_or_create_company_working as find_or_create_company,
+    fetch_job_text_playwright,
+    close_browser,
+    extract_job_text_from_html,
+    build_extraction_prompts,
+    EXTRACTION_SYSTEM_PROMPT,
+    EXTRACTION_MAX_TOKENS,
+    EXTRACTION_SEED,
+    parse_extraction_responses,
+    build_notion_page_request,
+    split_description_overflow,
+    get_company_database_id,
+    company_name_filter,
     OPENAI_API_KEY,
     NOTION_TOKEN,
     NOTION_DATABASE_ID
@@ -74,13 +92,24 @@ if missing_vars:
 # -----------------------------
 # Logging Setup
 # -----------------------------
+# Handlers on the event loop only enqueue records; a background listener
+# thread, started and stopped by main(), does the console and file writes.
+# Records logged before it starts wait in the queue.
+log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(log_formatter)
+file_handler = logging.FileHandler("slack_jobbot_async_safe.log")
+file_handler.setFormatter(log_formatter)
+
+log_queue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, stream_handler, file_handler)
+
+# force=True: importing slack_bot_fixed has already configured the root
+# logger, which would otherwise make basicConfig a no-op
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("slack_jobbot_async_safe.log")
-    ]
+    handlers=[QueueHandler(log_queue)],
+    force=True
 )
 
 logger = logging.getLogger(__name__)
@@ -88,8 +117,77 @@ logger = logging.getLogger(__name__)
 # -----------------------------
 # Thread Pool for Blocking Operations
 # -----------------------------
-# This is crucial for preventing dispatch_failed errors
-executor = ThreadPoolExecutor(max_workers=4)
+# Only genuinely synchronous work (HTML parsing) runs in the
+# loop's default executor, which main() sizes, installs and shuts down;
+# network calls to OpenAI/Notion/job sites are native coroutines
+THREAD_POOL_SIZE = int(os.getenv("THREAD_POOL_SIZE", "8"))
+
+# Cap on jobs processed at once across all messages; the semaphore is
+# created in main() so it binds to the running event loop
+MAX_CONCURRENT_JOBS = int(os.getenv("MAX_CONCURRENT_JOBS", "8"))
+job_semaphore: Optional[asyncio.Semaphore] = None
+
+# Only the first few distinct URLs of a message are processed
+MAX_URLS_PER_MESSAGE = int(os.getenv("MAX_URLS_PER_MSG", "5"))
+
+# -----------------------------
+# Async API Clients
+# -----------------------------
+openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+notion_client = AsyncNotionClient(auth=NOTION_TOKEN)
+
+# Shared HTTP client for fetching job pages, created in main() so its
+# connection pool is reused across jobs
+http_client: Optional[httpx.AsyncClient] = None
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+# HTTP/2 is only enabled when the h2 package (httpx[http2]) is installed
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# -----------------------------
+# API Retry Policy
+# -----------------------------
+API_MAX_ATTEMPTS = 5
+API_MAX_BACKOFF = 30  # seconds
+
+def _is_retryable(error: Exception) -> bool:
+    """Rate limits, server errors and network blips are retried; anything else is not"""
+    if isinstance(error, (RateLimitError, APIConnectionError, RequestTimeoutError)):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code >= 500
+    if isinstance(error, APIResponseError):
+        return error.status == 429 or error.status >= 500
+    return False
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the server's Retry-After hint (seconds) from an API error, if present"""
+    headers = getattr(error, 'headers', None)
+    if headers is None:
+        headers = getattr(getattr(error, 'response', None), 'headers', None)
+    try:
+        return min(float(headers.get('retry-after')), API_MAX_BACKOFF)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+async def call_with_retry(func, **kwargs):
+    """Await func(**kwargs), retrying transient failures with jittered exponential backoff"""
+    for attempt in range(1, API_MAX_ATTEMPTS + 1):
+        try:
+            return await func(**kwargs)
+        except Exception as e:
+            if attempt == API_MAX_ATTEMPTS or not _is_retryable(e):
+                raise
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = random.uniform(0, min(API_MAX_BACKOFF, 2 ** attempt))
+            logger.warning(f"API call failed ({e}), retrying in {delay:.1f}s "
+                           f"(attempt {attempt}/{API_MAX_ATTEMPTS})")
+            await asyncio.sleep(delay)
 
 # -----------------------------
 # Slack App Setup
@@ -99,22 +197,195 @@ app = AsyncApp(
     signing_secret=SLACK_SIGNING_SECRET
 )
 
-# URL pattern for extracting URLs from messages
-URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+# URL pattern for extracting URLs from messages. Slack wraps links as
+# <url> or <url|label>, so stop at whitespace and those delimiters.
+URL_PATTERN = re.compile(r'https?://[^\s<>|]+')
+
+# Keywords that suggest a job posting URL, as one case-insensitive alternation
+# ('job' also covers 'jobs', 'career' covers 'careers')
+JOB_URL_PATTERN = re.compile(
+    r'job|career|position|hiring|vacancy|employment|opportunities|roles|apply|'
+    r'work|posting|opening|requisition|recruitment',
+    re.IGNORECASE
+)
 
 # -----------------------------
-# Synchronous Processing Function
+# Async Processing Pipeline
 # -----------------------------
-def process_job_sync(url: str) -> Dict[str, Any]:
+async def fetch_job_text_async(url: str) -> Optional[str]:
+    """Fetch job text: async Playwright first, then a plain async HTTP fetch"""
+    text = await fetch_job_text_playwright(url)
+    if text and len(text.strip()) > 100:  # Ensure we got substantial content
+        return text
+
+    try:
+        logger.info(f"Fetching job content with httpx: {url}")
+        response = await http_client.get(url)
+        response.raise_for_status()
+        # BeautifulSoup parsing is CPU-bound, keep it off the event loop
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(None, extract_job_text_from_html, response.text)
+    except Exception as e:
+        logger.error(f"HTTP fetch failed for {url}: {e}")
+        return None
+
+    if text and len(text.strip()) > 100:
+        return text
+
+    logger.warning(f"No substantial content found for {url}")
+    return None
+
+async def _request_extraction_async(prompt: str) -> Optional[str]:
+    """Run one extraction sub-prompt, returning the raw response or None on failure"""
+    try:
+        response = await call_with_retry(
+            openai_client.chat.completions.create,
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.3,
+            max_tokens=EXTRACTION_MAX_TOKENS,
+            seed=EXTRACTION_SEED
+        )
+        return response.choices[0].message.content
+
+    except Exception as e:
+        logger.error(f"OpenAI extraction failed: {e}")
+        return None
+
+async def extract_fields_async(job_text: str) -> Dict[str, Any]:
+    """Extract job fields with parallel OpenAI sub-prompts, falling back to defaults on failure"""
+    raw_responses = await asyncio.gather(
+        *(_request_extraction_async(prompt) for prompt in build_extraction_prompts(job_text))
+    )
+    return parse_extraction_responses(raw_responses, job_text)
+
+# The Company relation target never changes at runtime, and company pages
+# are only ever added, so both lookups are cached for the process lifetime
+_company_database_id: Optional[str] = None
+_company_cache: Dict[str, str] = {}
+# A company's lock lives while any job holds or waits for it, so distinct
+# names don't accumulate locks for the life of the process
+_company_locks: Dict[str, asyncio.Lock] = {}
+_company_lock_users: Dict[str, int] = {}
+
+async def _get_company_database_id() -> Optional[str]:
+    """Resolve the Company relation's database ID once"""
+    global _company_database_id
+    if _company_database_id is None:
+        database_info = await call_with_retry(notion_client.databases.retrieve, database_id=NOTION_DATABASE_ID)
+        _company_database_id = get_company_database_id(database_info)
+    return _company_database_id
+
+async def find_or_create_company_async(company_name: str) -> Optional[str]:
+    """Find existing company or create new one in the linked database"""
+    if not company_name or company_name.strip() == "":
+        return None
+
+    cache_key = company_name.strip().casefold()
+    if cache_key in _company_cache:
+        logger.info(f"Using cached company: {company_name}")
+        return _company_cache[cache_key]
+
+    # Concurrent jobs for the same company must not both create it
+    lock = _company_locks.setdefault(cache_key, asyncio.Lock())
+    _company_lock_users[cache_key] = _company_lock_users.get(cache_key, 0) + 1
+    try:
+        async with lock:
+            if cache_key in _company_cache:
+                return _company_cache[cache_key]
+            return await _lookup_or_create_company_async(company_name, cache_key)
+    finally:
+        _company_lock_users[cache_key] -= 1
+        if not _company_lock_users[cache_key]:
+            del _company_lock_users[cache_key]
+            del _company_locks[cache_key]
+
+async def _lookup_or_create_company_async(company_name: str, cache_key: str) -> Optional[str]:
+    try:
+        company_database_id = await _get_company_database_id()
+        if not company_database_id:
+            return None
+
+        # Search for existing company
+        search_results = await call_with_retry(
+            notion_client.databases.query,
+            database_id=company_database_id,
+            filter=company_name_filter(company_name)
+        )
+
+        if search_results.get("results"):
+            company_id = search_results["results"][0]["id"]
+            logger.info(f"Found existing company: {company_name}")
+            _company_cache[cache_key] = company_id
+            return company_id
+
+        # Create new company
+        new_company = await call_with_retry(
+            notion_client.pages.create,
+            parent={"database_id": company_database_id},
+            properties={
+                "Name": {"title": [{"text": {"content": company_name.strip()}}]}
+            }
+        )
+
+        company_id = new_company["id"]
+        logger.info(f"Created new company: {company_name}")
+        _company_cache[cache_key] = company_id
+        return company_id
+
+    except Exception as e:
+        logger.error(f"Error handling company '{company_name}': {e}")
+        return None
+
+async def append_description_overflow_async(page_id: str, batches: list):
+    """Append description chunks that didn't fit in pages.create to the toggle block"""
+    if not batches:
+        return
+
+    page_blocks = await call_with_retry(notion_client.blocks.children.list, block_id=page_id)
+    toggle_id = page_blocks["results"][0]["id"]
+
+    # Appends to the same block run in order so the text stays in sequence
+    for batch in batches:
+        await call_with_retry(notion_client.blocks.children.append, block_id=toggle_id, children=batch)
+
+async def create_notion_page_async(fields: Dict[str, Any], job_url: str, job_text: str) -> Optional[Dict[str, Any]]:
+    """Create the Notion page, using the summary returned by field extraction"""
+    try:
+        summary = fields.get("Summary") or "Job summary not available"
+        company_id = await find_or_create_company_async(fields.get("Company", ""))
+
+        page_request = build_notion_page_request(fields, job_url, job_text, summary, company_id)
+        overflow_batches = split_description_overflow(page_request)
+        new_page = await call_with_retry(notion_client.pages.create, **page_request)
+        try:
+            await append_description_overflow_async(new_page["id"], overflow_batches)
+        except Exception as e:
+            # The page itself exists; a short description beats a failed job
+            logger.warning(f"Could not append full description to {new_page.get('id')}: {e}")
+
+        logger.info(f"Successfully created Notion page: {new_page.get('id')}")
+        return new_page
+
+    except Exception as e:
+        logger.error(f"Failed to create Notion page: {e}")
+        return None
+
+async def _process_job_uncached(url: str) -> Dict[str, Any]:
     """
-    Synchronous job processing function to be run in thread pool.
-    This keeps all blocking operations out of the async event loop.
+    Fetch, extract and store a job posting.
+    Network I/O is awaited directly; only sync work goes to the thread pool,
+    so the event loop stays responsive and dispatch_failed errors are avoided.
     """
     try:
-        logger.info(f"Processing job URL (sync): {url}")
+        logger.info(f"Processing job URL: {url}")
 
-        # Step 1: Fetch job content (blocking operation)
-        job_text = fetch_job_text(url)
+        # Step 1: Fetch job content
+        job_text = await fetch_job_text_async(url)
         if not job_text:
             return {
                 'success': False,
@@ -123,8 +394,8 @@ def process_job_sync(url: str) -> Dict[str, Any]:
 
         logger.info(f"Fetched {len(job_text)} characters from {url}")
 
-        # Step 2: Extract fields using AI (blocking operation)
-        fields = extract_fields(job_text)
+        # Step 2: Extract fields using AI
+        fields = await extract_fields_async(job_text)
 
         logger.info(f"Extracted fields:")
         logger.info(f"  Position: {fields.get('Position', 'Not found')}")
@@ -134,8 +405,8 @@ def process_job_sync(url: str) -> Dict[str, Any]:
         logger.info(f"  Commitment: {fields.get('Commitment', 'Not found')}")
         logger.info(f"  Industry: {fields.get('Industry', [])}")
 
-        # Step 3: Create Notion page (blocking operation)
-        new_page = create_notion_page(fields, url, job_text)
+        # Step 3: Create Notion page
+        new_page = await create_notion_page_async(fields, url, job_text)
 
         if new_page:
             result = {
@@ -161,52 +432,168 @@ def process_job_sync(url: str) -> Dict[str, Any]:
         }
 
 # -----------------------------
-# Async Wrapper Functions
+# Result Cache
 # -----------------------------
+# Successful results are remembered per canonical URL so re-pasted links
+# don't re-run fetch + OpenAI + Notion (and don't create duplicate pages)
+JOB_CACHE_TTL = 6 * 3600  # seconds
+JOB_CACHE_MAX_SIZE = 1024
+TRACKING_PARAMS = {'ref', 'referrer', 'src', 'trk', 'gclid', 'fbclid', 'mc_cid', 'mc_eid'}
+
+_job_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+# A URL's lock lives while any submission holds or waits for it; the count
+# decides when it can be dropped without splitting waiters across two locks
+_job_locks: Dict[str, asyncio.Lock] = {}
+_job_lock_users: Dict[str, int] = {}
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a job URL for caching: lowercase host, no fragment or tracking params"""
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/',
+                       urlencode(query), ''))
+
+def _get_cached_result(key: str) -> Optional[Dict[str, Any]]:
+    entry = _job_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at > JOB_CACHE_TTL:
+        del _job_cache[key]
+        return None
+    return result
+
+def _store_result(key: str, result: Dict[str, Any]):
+    _job_cache[key] = (time.monotonic(), result)
+    _job_cache.move_to_end(key)
+    while len(_job_cache) > JOB_CACHE_MAX_SIZE:
+        _job_cache.popitem(last=False)
+
 async def process_job_async(url: str) -> Dict[str, Any]:
     """
-    Async wrapper that runs synchronous processing in thread pool.
-    This is the key to preventing dispatch_failed errors.
+    Process a job URL, reusing the result of an earlier successful run.
+    Concurrent submissions of the same URL wait on one in-flight job.
     """
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(executor, process_job_sync, url)
-    return result
+    key = canonicalize_url(url)
+
+    cached = _get_cached_result(key)
+    if cached is not None:
+        logger.info(f"Using cached result for {url}")
+        return cached
+
+    lock = _job_locks.setdefault(key, asyncio.Lock())
+    _job_lock_users[key] = _job_lock_users.get(key, 0) + 1
+    try:
+        async with lock:
+            # Another submission may have finished while we waited
+            cached = _get_cached_result(key)
+            if cached is not None:
+                logger.info(f"Using cached result for {url}")
+                return cached
+
+            result = await _process_job_uncached(url)
+            if result.get('success'):
+                _store_result(key, result)
+            return result
+    finally:
+        _job_lock_users[key] -= 1
+        if not _job_lock_users[key]:
+            del _job_lock_users[key]
+            del _job_locks[key]
 
 # -----------------------------
 # Helper Functions
 # -----------------------------
-def extract_urls_from_text(text: str) -> list:
-    """Extract URLs from text"""
-    return URL_PATTERN.findall(text)
+def extract_urls_from_text(text: str, limit: Optional[int] = None) -> list:
+    """Extract distinct URLs from text in order, stopping once `limit` are found"""
+    urls: Dict[str, None] = {}
+    for match in URL_PATTERN.finditer(text):
+        urls.setdefault(match.group(0))
+        if limit and len(urls) >= limit:
+            break
+    return list(urls)
 
 def is_job_url(url: str) -> bool:
     """Check if URL looks like a job posting"""
-    job_keywords = [
-        'job', 'career', 'position', 'hiring', 'vacancy', 'employment',
-        'opportunities', 'roles', 'apply', 'jobs', 'careers', 'work',
-        'posting', 'opening', 'requisition', 'recruitment'
-    ]
-    url_lower = url.lower()
-    return any(keyword in url_lower for keyword in job_keywords)
+    return JOB_URL_PATTERN.search(url) is not None
+
+# HEAD probe for URLs that don't match the job pattern, cached briefly
+HEAD_CHECK_TIMEOUT = 3.0  # seconds
+HEAD_CACHE_TTL = 300  # seconds
+HEAD_CACHE_MAX_SIZE = 512
+HTML_CONTENT_TYPES = {'text/html', 'application/xhtml+xml'}
+
+_head_cache: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+
+async def _probe_url(url: str) -> bool:
+    try:
+        response = await http_client.head(url, timeout=HEAD_CHECK_TIMEOUT)
+    except Exception as e:
+        logger.info(f"HEAD check failed for {url}: {e}")
+        return False
+
+    # Plenty of servers don't implement HEAD; let the real fetch decide
+    if response.status_code in (405, 501):
+        return True
+    if not response.is_success:
+        return False
+
+    content_type = response.headers.get('content-type', '').split(';')[0].strip().lower()
+    return not content_type or content_type in HTML_CONTENT_TYPES
+
+async def looks_fetchable(url: str) -> bool:
+    """Cheap HEAD check that a URL serves an HTML page before doing any real work"""
+    key = canonicalize_url(url)
+    entry = _head_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] <= HEAD_CACHE_TTL:
+        return entry[1]
+
+    fetchable = await _probe_url(url)
+    _head_cache[key] = (time.monotonic(), fetchable)
+    _head_cache.move_to_end(key)
+    while len(_head_cache) > HEAD_CACHE_MAX_SIZE:
+        _head_cache.popitem(last=False)
+    return fetchable
+
+async def should_process_url(url: str) -> bool:
+    """Job-looking URLs always qualify; anything else has to pass the HEAD check"""
+    return is_job_url(url) or await looks_fetchable(url)
 
 # -----------------------------
 # Slack Message Helpers
 # -----------------------------
+# Static Block Kit payloads are built once at import; only the variable
+# text fields are formatted per message
+PROCESSING_TEXT = "🔍 Processing job posting... This may take a moment!"
+PROCESSING_BLOCKS = [
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "🔍 *Processing job posting...*\n\n_Fetching content, extracting information, and creating Notion page. This may take 30-60 seconds._"
+        }
+    }
+]
+VIEW_BUTTON_TEXT = {"type": "plain_text", "text": "View in Notion"}
+
+def _mrkdwn(text: str) -> Dict[str, str]:
+    """Build a mrkdwn text object"""
+    return {"type": "mrkdwn", "text": text}
+
+def _section(text: str) -> Dict[str, Any]:
+    """Build a section block with mrkdwn text"""
+    return {"type": "section", "text": _mrkdwn(text)}
+
 async def send_processing_message(say, thread_ts: Optional[str] = None) -> Optional[str]:
     """Send processing message and return message timestamp"""
     try:
         msg = await say({
-            "text": "🔍 Processing job posting... This may take a moment!",
+            "text": PROCESSING_TEXT,
             "thread_ts": thread_ts,
-            "blocks": [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "🔍 *Processing job posting...*\n\n_Fetching content, extracting information, and creating Notion page. This may take 30-60 seconds._"
-                    }
-                }
-            ]
+            "blocks": PROCESSING_BLOCKS
         })
         return msg.get('ts')
     except Exception as e:
@@ -230,20 +617,14 @@ async def update_with_result(say, ts: Optional[str], result: Dict[str, Any]):
             industry_text = ', '.join(industry) if isinstance(industry, list) and industry else 'Not specified'
 
             blocks = [
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"✅ *Successfully created Notion page!*\n\n*{position}*\n{company}"
-                    }
-                },
+                _section(f"✅ *Successfully created Notion page!*\n\n*{position}*\n{company}"),
                 {
                     "type": "section",
                     "fields": [
-                        {"type": "mrkdwn", "text": f"*Salary:*\n{salary}"},
-                        {"type": "mrkdwn", "text": f"*Location:*\n{location_text}"},
-                        {"type": "mrkdwn", "text": f"*Type:*\n{commitment}"},
-                        {"type": "mrkdwn", "text": f"*Industry:*\n{industry_text}"}
+                        _mrkdwn(f"*Salary:*\n{salary}"),
+                        _mrkdwn(f"*Location:*\n{location_text}"),
+                        _mrkdwn(f"*Type:*\n{commitment}"),
+                        _mrkdwn(f"*Industry:*\n{industry_text}")
                     ]
                 }
             ]
@@ -254,7 +635,7 @@ async def update_with_result(say, ts: Optional[str], result: Dict[str, Any]):
                     "elements": [
                         {
                             "type": "button",
-                            "text": {"type": "plain_text", "text": "View in Notion"},
+                            "text": VIEW_BUTTON_TEXT,
                             "url": result['page_url'],
                             "action_id": "view_notion"
                         }
@@ -271,15 +652,7 @@ async def update_with_result(say, ts: Optional[str], result: Dict[str, Any]):
             error_msg = result.get('error', 'Unknown error occurred')
             await say({
                 "text": f"❌ {error_msg}",
-                "blocks": [
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"❌ *Processing failed*\n\n{error_msg}"
-                        }
-                    }
-                ],
+                "blocks": [_section(f"❌ *Processing failed*\n\n{error_msg}")],
                 "thread_ts": ts,
                 "replace_original": False
             })
@@ -291,11 +664,36 @@ async def update_with_result(say, ts: Optional[str], result: Dict[str, Any]):
             "thread_ts": ts
         })
 
+async def handle_single_url(say, url: str, thread_ts: Optional[str] = None):
+    """Post a processing message, run the job and reply with the result"""
+    async with job_semaphore:
+        # Send processing message
+        msg_ts = await send_processing_message(say, thread_ts)
+
+        # Network I/O is async, sync work goes to the thread pool
+        result = await process_job_async(url)
+
+        # Update with result
+        await update_with_result(say, msg_ts or thread_ts, result)
+
+async def process_urls_concurrently(say, urls: list, thread_ts: Optional[str] = None):
+    """Run every URL from one message at the same time instead of one after another"""
+    results = await asyncio.gather(
+        *(handle_single_url(say, url, thread_ts) for url in urls),
+        return_exceptions=True
+    )
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error processing {url}: {result}")
+
 # -----------------------------
 # Slack Event Handlers
 # -----------------------------
 
-@app.event("app_mention")
+async def ack_event(ack):
+    """Acknowledge the event right away; the work runs as a lazy listener"""
+    await ack()
+
 async def handle_app_mention(event, say):
     """
     Handle @jobbot mentions
@@ -308,7 +706,8 @@ async def handle_app_mention(event, say):
 
         logger.info(f"App mention from user {user}: {text[:100]}...")
 
-        urls = extract_urls_from_text(text)
+        # Distinct URLs only, capped to bound the work per message
+        urls = extract_urls_from_text(text, MAX_URLS_PER_MESSAGE)
 
         if not urls:
             await say({
@@ -317,28 +716,23 @@ async def handle_app_mention(event, say):
             })
             return
 
-        # Process each URL
+        job_urls = []
         for url in urls:
             if is_job_url(url):
-                # Send processing message
-                msg_ts = await send_processing_message(say, thread_ts)
-
-                # Process in thread pool (non-blocking)
-                result = await process_job_async(url)
-
-                # Update with result
-                await update_with_result(say, msg_ts or thread_ts, result)
+                job_urls.append(url)
             else:
                 await say({
                     "text": f"🤔 That doesn't look like a job posting URL. I work best with job/career pages:\n`{url}`",
                     "thread_ts": thread_ts
                 })
 
+        # Process all job URLs concurrently
+        await process_urls_concurrently(say, job_urls, thread_ts)
+
     except Exception as e:
         logger.error(f"Error in app_mention handler: {e}")
         # Don't crash the handler - just log the error
 
-@app.event("message")
 async def handle_message(event, say):
     """
     Handle direct messages
@@ -358,7 +752,8 @@ async def handle_message(event, say):
 
         logger.info(f"Direct message from user {user}: {text[:100]}...")
 
-        urls = extract_urls_from_text(text)
+        # Distinct URLs only, capped to bound the work per message
+        urls = extract_urls_from_text(text, MAX_URLS_PER_MESSAGE)
 
         if not urls:
             await say({
@@ -366,27 +761,26 @@ async def handle_message(event, say):
             })
             return
 
-        # Process each URL
-        for url in urls:
-            if is_job_url(url):
-                # Send processing message
-                msg_ts = await send_processing_message(say)
-
-                # Process in thread pool (non-blocking)
-                result = await process_job_async(url)
+        # For non-job URLs in DMs, try anyway as long as they serve HTML
+        checks = await asyncio.gather(*(should_process_url(url) for url in urls))
+        for url, ok in zip(urls, checks):
+            if not ok:
+                await say({
+                    "text": f"🤔 I couldn't load a web page from that link, so I skipped it:\n`{url}`"
+                })
 
-                # Update with result
-                await update_with_result(say, msg_ts, result)
-            else:
-                # For non-job URLs in DMs, try anyway
-                msg_ts = await send_processing_message(say)
-                result = await process_job_async(url)
-                await update_with_result(say, msg_ts, result)
+        # Process all remaining URLs concurrently
+        await process_urls_concurrently(say, [url for url, ok in zip(urls, checks) if ok])
 
     except Exception as e:
         logger.error(f"Error in message handler: {e}")
         # Don't crash the handler - just log the error
 
+# Lazy listeners: Slack gets its ack immediately and the handler body runs
+# afterwards, so slow processing can never miss the 3 second deadline
+app.event("app_mention")(ack=ack_event, lazy=[handle_app_mention])
+app.event("message")(ack=ack_event, lazy=[handle_message])
+
 @app.command("/addjob")
 async def handle_addjob_command(ack, command, say):
     """
@@ -408,7 +802,7 @@ async def handle_addjob_command(ack, command, say):
             })
             return
 
-        urls = extract_urls_from_text(text)
+        urls = extract_urls_from_text(text, limit=1)
 
         if not urls:
             await say({
@@ -417,16 +811,7 @@ async def handle_addjob_command(ack, command, say):
             return
 
         # Process the first URL
-        url = urls[0]
-
-        # Send processing message
-        msg_ts = await send_processing_message(say)
-
-        # Process in thread pool (non-blocking)
-        result = await process_job_async(url)
-
-        # Update with result
-        await update_with_result(say, msg_ts, result)
+        await handle_single_url(say, urls[0])
 
     except Exception as e:
         logger.error(f"Error in slash command handler: {e}")
@@ -436,7 +821,8 @@ async def handle_addjob_command(ack, command, say):
 async def handle_errors(error, body, logger_slack):
     """Global error handler"""
     logger.error(f"Slack app error: {error}")
-    logger.error(f"Request body: {json.dumps(body, indent=2, default=str)}")
+    # Compact single-line dump: cheap to build and easy to grep in the log
+    logger.error(f"Request body: {json.dumps(body, separators=(',', ':'), default=str)}")
 
 # -----------------------------
 # Main Function
@@ -444,11 +830,27 @@ async def handle_errors(error, body, logger_slack):
 
 async def main():
     """Start the Slack bot with async-safe event handling"""
+    global http_client, job_semaphore
+
+    job_semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+    log_listener.start()
+
+    executor = ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="jobbot")
+    asyncio.get_running_loop().set_default_executor(executor)
+
+    http_client = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=HTTP_LIMITS,
+        timeout=15.0,
+        follow_redirects=True,
+        headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    )
+
     try:
         handler = AsyncSocketModeHandler(app, SLACK_APP_TOKEN)
 
         logger.info("🤖 JobBot Slack Integration (Async-Safe) starting...")
-        logger.info("✓ Thread pool for blocking operations")
+        logger.info("✓ Async OpenAI/Notion/HTTP calls, thread pool only for sync work")
         logger.info("✓ Prevents dispatch_failed errors")
         logger.info("✓ Robust JSON parsing and error handling")
         logger.info("✓ AI-powered job extraction")
@@ -467,8 +869,14 @@ async def main():
         await handler.start_async()
 
     except Exception as e:
-        logger.error(f"Failed to start Slack bot: {e}")
+        # Logged with the traceback here, while the queue listener still runs
+        logger.exception(f"Failed to start Slack bot: {e}")
         raise
+    finally:
+        await http_client.aclose()
+        await close_browser()
+        executor.shutdown(wait=True)
+        log_listener.stop()  # flushes queued records
 
 if __name__ == "__main__":
     print("🚀 Starting JobBot Slack Integration (Async-Safe Version)...")
@@ -488,5 +896,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\n👋 JobBot stopped")
     except Exception as e:
+        # main() has already logged the full traceback before stopping logging
         print(f"❌ Error: {e}")
-        logging.exception("Full error details:")
@@ -4,7 +4,7 @@ JobBot Slack Integration - Fixed Version
 Addresses dispatch_failed errors and JSON parsing issues
 
 Key fixes:
-- Robust JSON parsing with multiple fallback strategies
+- Reliable JSON extraction via OpenAI JSON mode
 - Proper text length handling for Notion API
 - Comprehensive error handling in async event handlers
 - Better logging and debugging
@@ -16,19 +16,22 @@ import re
 import json
 import logging
 import asyncio
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import Optional, Dict, Any, Tuple, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 from slack_bolt.async_app import AsyncApp
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
+from slack_sdk.errors import SlackApiError
 from dotenv import load_dotenv
-import requests
-from bs4 import BeautifulSoup
-import openai
-from notion_client import Client as NotionClient
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer
+from openai import AsyncOpenAI
+from notion_client import AsyncClient as NotionClient
 
 # Playwright imports with fallback
 try:
-    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
@@ -60,9 +63,22 @@ if missing_vars:
     exit(1)
 
 # Initialize clients
-openai_client = openai.OpenAI(api_key=OPENAI_API_KEY)
+openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY)
 notion_client = NotionClient(auth=NOTION_TOKEN)
 
+# Shared HTTP client for the fallback page fetch, created in main() so its
+# connection pool is reused across jobs. httpx negotiates gzip/deflate
+# (and br when brotli is installed) on its own.
+http_client: Optional[httpx.AsyncClient] = None
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+# HTTP/2 is only enabled when the h2 package (httpx[http2]) is installed
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # -----------------------------
 # Logging Setup
 # -----------------------------
@@ -82,96 +98,153 @@ logger = logging.getLogger(__name__)
 # -----------------------------
 app = AsyncApp(token=SLACK_BOT_TOKEN)
 
-# URL regex pattern
-URL_PATTERN = re.compile(
-    r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+# Jobs processed at once; Notion starts throttling beyond ~5 concurrent
+# writers. The semaphore is created in main() on the running event loop.
+MAX_CONCURRENT_JOBS = 5
+job_semaphore: Optional[asyncio.Semaphore] = None
+
+# URL regex pattern. Slack wraps links as <url> or <url|label>, so stop at
+# whitespace, those delimiters and quotes.
+URL_PATTERN = re.compile(r'https?://[^\s<>"|]+')
+URL_TRAILING_PUNCTUATION = ".,;:!?)'"
+
+# Keywords that mark a URL as a job posting, matched in a single pass
+# ("jobs"/"careers" are covered by "job"/"career")
+JOB_URL_PATTERN = re.compile(
+    r'job|career|position|hiring|vacancy|employment|opportunities|roles|apply|work|posting',
+    re.IGNORECASE
 )
 
 # -----------------------------
 # Core Functions
 # -----------------------------
 
-def fetch_job_text_playwright(url: str) -> Optional[str]:
+# One Chromium instance is launched on first use and shared by every job;
+# each fetch gets its own throwaway context so cookies don't leak between
+# sites. Closed by close_browser() on shutdown.
+_playwright = None
+_browser = None
+_browser_lock: Optional[asyncio.Lock] = None
+
+async def _get_browser():
+    """Return the shared browser, (re)launching it if needed"""
+    global _playwright, _browser, _browser_lock
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+        return _browser
+
+async def close_browser():
+    """Shut down the shared browser and Playwright driver"""
+    global _playwright, _browser
+    try:
+        if _browser is not None:
+            await _browser.close()
+        if _playwright is not None:
+            await _playwright.stop()
+    except Exception as e:
+        logger.warning(f"Error closing browser: {e}")
+    finally:
+        _browser = None
+        _playwright = None
+
+async def fetch_job_text_playwright(url: str) -> Optional[str]:
     """Fetch job text using Playwright with error handling"""
     if not PLAYWRIGHT_AVAILABLE:
         logger.warning("Playwright not available")
         return None
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            try:
-                page = browser.new_page()
-                logger.info(f"Fetching job content with Playwright: {url}")
-                page.goto(url, timeout=20000)
-                page.wait_for_timeout(2000)
-                text = page.inner_text("body")
-                return text.strip() if text else None
-            finally:
-                browser.close()
+        browser = await _get_browser()
+        context = await browser.new_context()
+        try:
+            page = await context.new_page()
+            logger.info(f"Fetching job content with Playwright: {url}")
+            await page.goto(url, timeout=20000)
+            await page.wait_for_timeout(2000)
+            text = await page.inner_text("body")
+            return text.strip() if text else None
+        finally:
+            await context.close()
     except Exception as e:
         logger.error(f"Playwright fetch failed for {url}: {e}")
         return None
 
-def fetch_job_text_requests(url: str) -> Optional[str]:
-    """Fetch job text using requests + BeautifulSoup"""
-    try:
-        logger.info(f"Fetching job content with requests: {url}")
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, timeout=15, headers=headers)
-        response.raise_for_status()
+# Only the tags job content lives in are parsed; head, nav, inline
+# scripts at the top level etc. are skipped by the parser entirely
+CONTENT_STRAINER = SoupStrainer(["main", "article", "section", "div", "p"])
+
+# Checked in priority order; the first selector that matches wins
+CONTENT_SELECTORS = (
+    ".job-description",
+    ".job-content",
+    "[data-job-description]",
+    ".posting-content",
+    ".job-posting",
+    "main",
+    ".content"
+)
+CONTENT_SELECTOR = ", ".join(CONTENT_SELECTORS)
+
+def extract_job_text_from_html(html: str) -> Optional[str]:
+    """Pull the job description text out of a fetched HTML page"""
+    soup = BeautifulSoup(html, "lxml", parse_only=CONTENT_STRAINER)
+
+    # Scripts and styles nested inside kept containers still need removing
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    # Try to find job content in common containers: one DOM walk collects
+    # every candidate, then the priority order is applied to that short list
+    candidates = soup.select(CONTENT_SELECTOR)
+    text = ""
+    for selector in CONTENT_SELECTORS:
+        elements = [elem for elem in candidates if elem.css.match(selector)]
+        if elements:
+            text = " ".join(elem.get_text() for elem in elements)
+            break
+
+    # Fallback to all paragraphs
+    if not text:
+        paragraphs = soup.find_all("p")
+        text = "\n".join(p.get_text() for p in paragraphs)
 
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-
-        # Try to find job content in common containers
-        content_selectors = [
-            ".job-description",
-            ".job-content",
-            "[data-job-description]",
-            ".posting-content",
-            ".job-posting",
-            "main",
-            ".content"
-        ]
-
-        text = ""
-        for selector in content_selectors:
-            elements = soup.select(selector)
-            if elements:
-                text = " ".join(elem.get_text() for elem in elements)
-                break
-
-        # Fallback to all paragraphs
-        if not text:
-            paragraphs = soup.find_all("p")
-            text = "\n".join(p.get_text() for p in paragraphs)
+    # Final fallback to body text
+    if not text:
+        text = soup.get_text()
 
-        # Final fallback to body text
-        if not text:
-            text = soup.get_text()
+    return text.strip() if text else None
 
-        return text.strip() if text else None
+async def fetch_job_text_requests(url: str) -> Optional[str]:
+    """Fetch job text using httpx + BeautifulSoup"""
+    try:
+        logger.info(f"Fetching job content with httpx: {url}")
+        response = await http_client.get(url)
+        response.raise_for_status()
+
+        # Parsing is synchronous; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, extract_job_text_from_html, response.text)
 
     except Exception as e:
         logger.error(f"Requests fetch failed for {url}: {e}")
         return None
 
-def fetch_job_text(url: str) -> Optional[str]:
+async def fetch_job_text(url: str) -> Optional[str]:
     """Fetch job text with multiple fallback strategies"""
     try:
         # Try Playwright first
-        text = fetch_job_text_playwright(url)
+        text = await fetch_job_text_playwright(url)
         if text and len(text.strip()) > 100:  # Ensure we got substantial content
             return text
 
-        # Fallback to requests
-        text = fetch_job_text_requests(url)
+        # Fallback to a plain HTTP fetch
+        text = await fetch_job_text_requests(url)
         if text and len(text.strip()) > 100:
             return text
 
@@ -182,82 +255,46 @@ def fetch_job_text(url: str) -> Optional[str]:
         logger.error(f"All fetch methods failed for {url}: {e}")
         return None
 
-def clean_json_response(text: str) -> str:
-    """Clean OpenAI response to extract valid JSON"""
-    if not text:
-        return ""
-
-    text = text.strip()
-
-    # Remove markdown code blocks
-    if "```json" in text:
-        start = text.find("```json") + 7
-        end = text.find("```", start)
-        if end != -1:
-            text = text[start:end].strip()
-    elif "```" in text:
-        # Handle generic code blocks
-        parts = text.split("```")
-        if len(parts) >= 3:
-            text = parts[1].strip()
-            # Remove language identifier if present
-            lines = text.split('\n')
-            if lines[0].strip() in ['json', 'JSON']:
-                text = '\n'.join(lines[1:])
-
-    # Remove any leading/trailing non-JSON text
-    # Find first { and last }
-    start_idx = text.find('{')
-    end_idx = text.rfind('}')
-
-    if start_idx != -1 and end_idx != -1 and start_idx < end_idx:
-        text = text[start_idx:end_idx + 1]
-
-    return text.strip()
-
-def generate_job_summary(job_text: str) -> str:
-    """Generate AI summary with error handling"""
-    try:
-        prompt = f"""Create a concise 2-3 sentence summary of this job posting.
-Focus on: role level, key responsibilities, and important requirements.
-Keep under 300 characters.
+# JSON mode guarantees a parseable object; the system message keeps the
+# model from wrapping it in prose
+EXTRACTION_SYSTEM_PROMPT = "Return only JSON."
 
-Job posting:
-{job_text[:3000]}"""
+# Each sub-prompt's JSON fits comfortably in this; capping it bounds the
+# worst-case generation time, and a fixed seed keeps reruns consistent
+EXTRACTION_MAX_TOKENS = 400
+EXTRACTION_SEED = 0
 
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=100
-        )
+# Extraction is split into two small prompts that run in parallel; each
+# returns a tiny JSON object and the results are merged client-side
+EXTRACT_BASIC_PROMPT = """You are a job posting analyzer. Extract the basics from this job posting and return ONLY a valid JSON object.
 
-        summary = response.choices[0].message.content
-        return summary.strip() if summary else "Job summary not available"
+1. Position: The job title (e.g., "Software Engineer", "Marketing Manager")
+2. Company: The hiring company name
+3. Commitment: Employment type (Full time, Part time, Contract, Freelance, Internship, etc.)
+4. Summary: A concise 2-3 sentence summary focusing on role level, key responsibilities and important requirements, under 300 characters
 
-    except Exception as e:
-        logger.error(f"Failed to generate summary: {e}")
-        return "Job summary not available"
+Return this exact JSON structure:
+{{
+  "Position": "exact job title from posting",
+  "Company": "company name",
+  "Commitment": "employment type",
+  "Summary": "2-3 sentence summary"
+}}
 
-def extract_fields_robust(job_text: str) -> Dict[str, Any]:
-    """Extract fields with robust JSON parsing and error handling"""
+Use empty string "" for missing fields.
 
-    prompt = f"""You are a job posting analyzer. Extract information from this job posting and return ONLY a valid JSON object.
+Job posting text:
+{job_text}"""
 
-Look for these fields in the job posting text:
+EXTRACT_DETAIL_PROMPT = """You are a job posting analyzer. Extract pay, industry and location details from this job posting and return ONLY a valid JSON object.
 
-1. Position: The job title (e.g., "Software Engineer", "Marketing Manager")
-2. Company: The hiring company name
-3. Salary: Any compensation information (salary ranges, hourly rates, "competitive", benefits packages)
-4. Commitment: Employment type (Full time, Part time, Contract, Freelance, Internship, etc.)
-5. Industry: Business sectors (Technology, Healthcare, Finance, Marketing, etc.)
-6. Location: Work locations (cities, states, "Remote", "Hybrid", etc.)
+1. Salary: Any compensation information (salary ranges, hourly rates, "competitive", benefits packages)
+2. Industry: Business sectors (Technology, Healthcare, Finance, Marketing, etc.)
+3. Location: Work locations (cities, states, "Remote", "Hybrid", etc.)
 
 Return this exact JSON structure:
 {{
-  "Position": "exact job title from posting",
-  "Company": "company name",
   "Salary": "any compensation details found",
-  "Commitment": "employment type",
   "Industry": ["relevant", "industries"],
   "Location": ["work", "locations"]
 }}
@@ -266,118 +303,129 @@ CRITICAL RULES:
 - Look throughout the ENTIRE text for salary/pay information
 - For Location: include "Remote" if remote work is mentioned anywhere
 - For arrays: always return arrays even for single items
-- Use empty string "" for missing text fields
-- Use empty array [] for missing array fields
-- Return ONLY the JSON - no explanations, no markdown blocks
+- Use empty string "" for missing Salary and empty array [] for missing arrays
 
 Job posting text:
-{job_text[:8000]}"""
-
-    fallback_data = {
+{job_text}"""
+
+def build_extraction_prompts(job_text: str) -> Tuple[str, str]:
+    """Build the basic and detail OpenAI prompts for structured field extraction"""
+    job_text = job_text[:8000]
+    return (
+        EXTRACT_BASIC_PROMPT.format(job_text=job_text),
+        EXTRACT_DETAIL_PROMPT.format(job_text=job_text)
+    )
+
+def fallback_fields() -> Dict[str, Any]:
+    """Default fields used when extraction fails"""
+    return {
         "Position": "Position Not Specified",
         "Company": "",
         "Salary": "",
         "Commitment": "Full time",
         "Industry": [],
-        "Location": []
+        "Location": [],
+        "Summary": "Job summary not available"
     }
 
-    try:
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3
-        )
+def _decode_json_object(raw_response: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode one JSON-mode OpenAI response into a dict, or None if it can't be parsed"""
+    logger.info(f"Raw OpenAI response: {(raw_response or '')[:200]}...")
 
-        raw_response = response.choices[0].message.content
-        logger.info(f"Raw OpenAI response: {raw_response[:200]}...")
+    if not raw_response or raw_response.strip() == "":
+        logger.error("Empty response from OpenAI")
+        return None
 
-        if not raw_response or raw_response.strip() == "":
-            logger.error("Empty response from OpenAI")
-            return fallback_data
+    try:
+        return json.loads(raw_response)
+    except json.JSONDecodeError as e:
+        logger.error(f"JSON decode error: {e}")
+        return None
+
+def _split_multiselect_values(values: List[Any]):
+    """Yield the comma-separated parts of each value, stripped and non-empty"""
+    for value in values:
+        if isinstance(value, str):
+            for part in value.split(','):
+                part = part.strip()
+                if part:
+                    yield part
+        elif value:
+            yield str(value)
+
+def parse_extraction_responses(raw_responses: List[Optional[str]], job_text: str) -> Dict[str, Any]:
+    """Merge the raw OpenAI extraction responses into cleaned job fields"""
+    fallback_data = fallback_fields()
+
+    fields: Dict[str, Any] = {}
+    for raw_response in raw_responses:
+        decoded = _decode_json_object(raw_response)
+        if isinstance(decoded, dict):
+            fields.update(decoded)
+
+    if not fields:
+        logger.error("No usable extraction response, using fallback")
+        return fallback_data
 
-        # Clean the JSON response
-        cleaned_json = clean_json_response(raw_response)
-        logger.info(f"Cleaned JSON: {cleaned_json[:200]}...")
+    # Validate required fields
+    required_fields = ["Position", "Company", "Salary", "Commitment", "Industry", "Location", "Summary"]
+    for field in required_fields:
+        if field not in fields:
+            fields[field] = fallback_data[field]
+
+    # Store full description for toggle blocks
+    fields["Full Description"] = job_text
+
+    # Clean and validate text fields
+    for field in ["Position", "Company", "Salary", "Commitment", "Summary"]:
+        if isinstance(fields[field], list):
+            # Convert list to string if needed
+            fields[field] = ", ".join(str(x) for x in fields[field] if str(x).strip())
+        elif not isinstance(fields[field], str):
+            fields[field] = str(fields[field]) if fields[field] is not None else ""
+
+    # Ensure lists are actually lists
+    for field in ["Industry", "Location"]:
+        if not isinstance(fields[field], list):
+            if isinstance(fields[field], str):
+                fields[field] = [fields[field]] if fields[field].strip() else []
+            else:
+                fields[field] = []
 
-        if not cleaned_json:
-            logger.error("No valid JSON found in response")
-            return fallback_data
+    # Split comma-joined values to avoid commas in multi-select, then
+    # dedupe keeping the model's order
+    for field in ["Location", "Industry"]:
+        if fields[field]:
+            fields[field] = list(dict.fromkeys(_split_multiselect_values(fields[field])))
 
-        # Parse JSON with multiple attempts
-        try:
-            fields = json.loads(cleaned_json)
-
-            # Validate required fields
-            required_fields = ["Position", "Company", "Salary", "Commitment", "Industry", "Location"]
-            for field in required_fields:
-                if field not in fields:
-                    fields[field] = fallback_data[field]
-
-            # Store full description for toggle blocks
-            fields["Full Description"] = job_text
-
-            # Clean and validate text fields
-            for field in ["Position", "Company", "Salary", "Commitment"]:
-                if isinstance(fields[field], list):
-                    # Convert list to string if needed
-                    fields[field] = ", ".join(str(x) for x in fields[field] if str(x).strip())
-                elif not isinstance(fields[field], str):
-                    fields[field] = str(fields[field]) if fields[field] is not None else ""
-
-            # Ensure lists are actually lists
-            for field in ["Industry", "Location"]:
-                if not isinstance(fields[field], list):
-                    if isinstance(fields[field], str):
-                        fields[field] = [fields[field]] if fields[field].strip() else []
-                    else:
-                        fields[field] = []
-
-            # Clean location data to avoid commas in multi-select
-            if fields.get("Location"):
-                cleaned_locations = []
-                for loc in fields["Location"]:
-                    if isinstance(loc, str) and loc.strip():
-                        # Split on comma and clean each part
-                        parts = [part.strip() for part in loc.split(',') if part.strip()]
-                        cleaned_locations.extend(parts)
-                    elif loc:
-                        cleaned_locations.append(str(loc))
-                fields["Location"] = list(set(cleaned_locations))  # Remove duplicates
-
-            # Clean industry data similarly
-            if fields.get("Industry"):
-                cleaned_industries = []
-                for ind in fields["Industry"]:
-                    if isinstance(ind, str) and ind.strip():
-                        parts = [part.strip() for part in ind.split(',') if part.strip()]
-                        cleaned_industries.extend(parts)
-                    elif ind:
-                        cleaned_industries.append(str(ind))
-                fields["Industry"] = list(set(cleaned_industries))  # Remove duplicates
-
-            logger.info(f"Successfully parsed and cleaned fields")
-            return fields
-
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            logger.error(f"Failed JSON string: '{cleaned_json}'")
-
-            # Try to fix common JSON issues
-            try:
-                # Fix common issues like trailing commas, single quotes, etc.
-                fixed_json = cleaned_json.replace("'", '"')  # Replace single quotes
-                fixed_json = re.sub(r',(\s*[}\]])', r'\1', fixed_json)  # Remove trailing commas
-                fields = json.loads(fixed_json)
-                logger.info("Successfully parsed JSON after fixing")
-                return fields
-            except:
-                logger.error("Could not fix JSON, using fallback")
-                return fallback_data
+    logger.info(f"Successfully parsed and cleaned fields")
+    return fields
 
+async def _request_extraction(prompt: str) -> Optional[str]:
+    """Run one extraction sub-prompt, returning the raw response or None on failure"""
+    try:
+        response = await openai_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.3,
+            max_tokens=EXTRACTION_MAX_TOKENS,
+            seed=EXTRACTION_SEED
+        )
+        return response.choices[0].message.content
     except Exception as e:
         logger.error(f"OpenAI extraction failed: {e}")
-        return fallback_data
+        return None
+
+async def extract_fields_robust(job_text: str) -> Dict[str, Any]:
+    """Extract fields with parallel sub-prompts, robust JSON parsing and error handling"""
+    raw_responses = await asyncio.gather(
+        *(_request_extraction(prompt) for prompt in build_extraction_prompts(job_text))
+    )
+    return parse_extraction_responses(raw_responses, job_text)
 
 def truncate_text_for_notion(text: str, max_length: int = 2000) -> str:
     """Truncate text to fit Notion's field limits"""
@@ -396,150 +444,233 @@ def truncate_text_for_notion(text: str, max_length: int = 2000) -> str:
     # Fallback to hard truncate with ellipsis
     return truncated[:max_length - 3] + "..."
 
-def create_notion_page_robust(fields: Dict[str, Any], job_url: str, job_text: str) -> Optional[Dict[str, Any]]:
-    """Create Notion page with robust error handling - matches working jobbot_cli implementation exactly"""
-
-    try:
-        # Generate summary
-        summary = generate_job_summary(job_text)
-        full_description = fields.get("Full Description", job_text)
-
-        # Handle commitment field - convert to list format
-        commitment = fields.get("Commitment", "Full time")
-        commitment_list = [commitment] if commitment else ["Full time"]
-
-        # Clean multi-select fields (same as working version)
-        def clean_multiselect_values(values, field_name):
-            if not values:
-                return []
-            if isinstance(values, str):
-                values = [values]
-
-            cleaned = []
-            for value in values:
-                if value and isinstance(value, str):
-                    clean_value = str(value).strip()[:100]
-                    if clean_value:
-                        cleaned.append(clean_value)
-            return cleaned
-
-        industry_values = clean_multiselect_values(fields.get("Industry", []), "Industry")
-        location_values = clean_multiselect_values(fields.get("Location", []), "Location")
-        commitment_values = clean_multiselect_values(commitment_list, "Commitment")
-
-        # Handle company relation - use the working find_or_create_company function
-        company_name = fields.get("Company", "")
-        company_id = find_or_create_company_working(company_name) if company_name else None
-
-        # Build properties - match the working version exactly
-        properties = {
-            "Position": {"title": [{"text": {"content": fields.get("Position", "Unknown")}}]},
-            "Status": {"select": {"name": "Researching"}},  # Same as working version
-            "Active v Archived": {"status": {"name": "In progress"}},  # Same as working version
-            "Job URL": {"url": job_url},
-            "Salary": {"rich_text": [{"text": {"content": fields.get("Salary", "")}}]},
-            "Commitment": {"multi_select": [{"name": c} for c in commitment_values]},
-            "Industry": {"multi_select": [{"name": i} for i in industry_values]},
-            "Location": {"multi_select": [{"name": l} for l in location_values]},
-            "Job Description": {"rich_text": [{"text": {"content": summary}}]},
+# Description chunks stay under Notion's 2000-char rich text limit.
+# DESCRIPTION_MAX_CHARS is the single truncation policy: text beyond it is
+# dropped and the toggle ends with DESCRIPTION_TRUNCATED_NOTE, added only by
+# build_notion_page_request. Notion accepts at most 100 children per
+# request; any excess is appended to the toggle in follow-up batches.
+DESCRIPTION_CHUNK_SIZE = 1900
+DESCRIPTION_MAX_CHARS = 20000
+NOTION_MAX_CHILDREN = 100
+DESCRIPTION_TRUNCATED_NOTE = "… description truncated, see the job URL for the full posting."
+
+def _paragraph_block(content: str) -> Dict[str, Any]:
+    """Build a Notion paragraph block"""
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [{"type": "text", "text": {"content": content}}]
         }
+    }
 
-        # Add company relation if found/created
-        if company_id:
-            properties["Company"] = {"relation": [{"id": company_id}]}
-
-        # Create toggle blocks with full job description (like working version)
-        content_blocks = [
-            {
-                "object": "block",
-                "type": "toggle",
-                "toggle": {
-                    "rich_text": [{"type": "text", "text": {"content": "Job Description"}}],
-                    "children": []
-                }
+def _clean_multiselect_values(values) -> List[str]:
+    """Strip multi-select option names and cap them at Notion's 100 chars"""
+    if isinstance(values, str):
+        values = [values]
+    return [value.strip()[:100] for value in values or [] if isinstance(value, str) and value.strip()]
+
+def build_notion_page_request(fields: Dict[str, Any], job_url: str, job_text: str,
+                              summary: str, company_id: Optional[str]) -> Dict[str, Any]:
+    """Build the pages.create arguments (parent, properties, children) for a job"""
+    full_description = fields.get("Full Description", job_text)
+
+    # Handle commitment field - convert to list format
+    commitment = fields.get("Commitment", "Full time")
+    commitment_list = [commitment] if commitment else ["Full time"]
+
+    industry_values = _clean_multiselect_values(fields.get("Industry", []))
+    location_values = _clean_multiselect_values(fields.get("Location", []))
+    commitment_values = _clean_multiselect_values(commitment_list)
+
+    # Build properties - match the working version exactly
+    properties = {
+        "Position": {"title": [{"text": {"content": fields.get("Position", "Unknown")}}]},
+        "Status": {"select": {"name": "Researching"}},  # Same as working version
+        "Active v Archived": {"status": {"name": "In progress"}},  # Same as working version
+        "Job URL": {"url": job_url},
+        "Salary": {"rich_text": [{"text": {"content": fields.get("Salary", "")}}]},
+        "Commitment": {"multi_select": [{"name": c} for c in commitment_values]},
+        "Industry": {"multi_select": [{"name": i} for i in industry_values]},
+        "Location": {"multi_select": [{"name": l} for l in location_values]},
+        "Job Description": {"rich_text": [{"text": {"content": summary}}]},
+    }
+
+    # Add company relation if found/created
+    if company_id:
+        properties["Company"] = {"relation": [{"id": company_id}]}
+
+    # Create toggle blocks with full job description (like working version)
+    content_blocks = [
+        {
+            "object": "block",
+            "type": "toggle",
+            "toggle": {
+                "rich_text": [{"type": "text", "text": {"content": "Job Description"}}],
+                "children": []
             }
-        ]
-
-        # Add job description content to toggle - ensure we use the actual job text
-        description_text = job_text if job_text else full_description
-        if not description_text:
-            description_text = "No job description available"
-
-        max_block_size = 2000
-        toggle_children = []
-        for i in range(0, len(description_text), max_block_size):
-            chunk = description_text[i:i+max_block_size]
-            if chunk.strip():  # Only add non-empty chunks
-                toggle_children.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{"type": "text", "text": {"content": chunk}}]
-                    }
-                })
-        content_blocks[0]["toggle"]["children"] = toggle_children
+        }
+    ]
 
-        # Log what we're creating
-        logger.info(f"Creating Notion page with properties:")
-        logger.info(f"  Position: {fields.get('Position', 'Unknown')}")
-        logger.info(f"  Company: {company_name} (ID: {company_id})")
-        logger.info(f"  Salary: {fields.get('Salary', 'Not specified')}")
-        logger.info(f"  Location: {location_values}")
-        logger.info(f"  Commitment: {commitment_values}")
-        logger.info(f"  Industry: {industry_values}")
+    # Add job description content to toggle - ensure we use the actual job text
+    description_text = job_text if job_text else full_description
+    if not description_text:
+        description_text = "No job description available"
+
+    # Slice by index; whitespace-only chunks are harmless to Notion
+    text_length = len(description_text)
+    kept_length = min(text_length, DESCRIPTION_MAX_CHARS)
+    toggle_children = [
+        _paragraph_block(description_text[i:min(i + DESCRIPTION_CHUNK_SIZE, kept_length)])
+        for i in range(0, kept_length, DESCRIPTION_CHUNK_SIZE)
+    ]
+    if text_length > DESCRIPTION_MAX_CHARS:
+        toggle_children.append(_paragraph_block(DESCRIPTION_TRUNCATED_NOTE))
+    content_blocks[0]["toggle"]["children"] = toggle_children
+
+    # Log what we're creating
+    logger.info(f"Creating Notion page with properties:")
+    logger.info(f"  Position: {fields.get('Position', 'Unknown')}")
+    logger.info(f"  Company: {fields.get('Company', '')} (ID: {company_id})")
+    logger.info(f"  Salary: {fields.get('Salary', 'Not specified')}")
+    logger.info(f"  Location: {location_values}")
+    logger.info(f"  Commitment: {commitment_values}")
+    logger.info(f"  Industry: {industry_values}")
+
+    return {
+        "parent": {"database_id": NOTION_DATABASE_ID},
+        "properties": properties,
+        "children": content_blocks
+    }
+
+def split_description_overflow(page_request: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+    """Trim the toggle to one request's worth of children; return the rest as append batches"""
+    toggle = page_request["children"][0]["toggle"]
+    overflow = toggle["children"][NOTION_MAX_CHILDREN:]
+    toggle["children"] = toggle["children"][:NOTION_MAX_CHILDREN]
+    return [overflow[i:i + NOTION_MAX_CHILDREN] for i in range(0, len(overflow), NOTION_MAX_CHILDREN)]
+
+async def append_description_overflow(page_id: str, batches: List[List[Dict[str, Any]]]):
+    """Append the remaining description chunks to the page's toggle block"""
+    if not batches:
+        return
+
+    page_blocks = await notion_client.blocks.children.list(block_id=page_id)
+    toggle_id = page_blocks["results"][0]["id"]
+
+    # Appends to the same block run in order so the text stays in sequence
+    for batch in batches:
+        await notion_client.blocks.children.append(block_id=toggle_id, children=batch)
 
+async def create_notion_page_robust(fields: Dict[str, Any], job_url: str, job_text: str,
+                                    summary: str, company_id: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Create Notion page with robust error handling - matches working jobbot_cli implementation exactly"""
+
+    try:
         # Create the page with content blocks (like working version)
-        new_page = notion_client.pages.create(
-            parent={"database_id": NOTION_DATABASE_ID},
-            properties=properties,
-            children=content_blocks
-        )
+        page_request = build_notion_page_request(fields, job_url, job_text, summary, company_id)
+        overflow_batches = split_description_overflow(page_request)
+        new_page = await notion_client.pages.create(**page_request)
+        try:
+            await append_description_overflow(new_page["id"], overflow_batches)
+        except Exception as e:
+            # The page itself exists; a short description beats a failed job
+            logger.warning(f"Could not append full description to {new_page.get('id')}: {e}")
 
         logger.info(f"Successfully created Notion page: {new_page.get('id')}")
         return new_page
 
     except Exception as e:
         logger.error(f"Failed to create Notion page: {e}")
-        if 'properties' in locals():
-            logger.error(f"Properties attempted: {json.dumps(properties, indent=2, default=str)}")
+        if 'page_request' in locals():
+            logger.error(f"Properties attempted: {json.dumps(page_request['properties'], separators=(',', ':'), default=str)}")
         return None
 
-def find_or_create_company_working(company_name: str) -> Optional[str]:
-    """Find existing company or create new one - exact copy from working jobbot_cli"""
-    if not company_name or company_name.strip() == "":
+def get_company_database_id(database_info: Dict[str, Any]) -> Optional[str]:
+    """Return the database ID the Company relation points to, if any"""
+    company_prop = database_info.get('properties', {}).get('Company', {})
+
+    if company_prop.get('type') != 'relation':
+        logger.warning("Company field is not a relation field")
         return None
 
-    try:
-        database_info = notion_client.databases.retrieve(database_id=NOTION_DATABASE_ID)
-        company_prop = database_info.get('properties', {}).get('Company', {})
+    company_database_id = company_prop.get('relation', {}).get('database_id')
+    if not company_database_id:
+        logger.warning("Could not find Company database ID")
+        return None
 
-        if company_prop.get('type') != 'relation':
-            logger.warning("Company field is not a relation field")
-            return None
+    return company_database_id
+
+def company_name_filter(company_name: str) -> Dict[str, Any]:
+    """Notion query filter matching a company by exact name"""
+    return {
+        "property": "Name",
+        "title": {
+            "equals": company_name.strip()
+        }
+    }
+
+# The Company relation target never changes at runtime, and company pages
+# are only ever added, so both lookups are cached for the process lifetime
+_company_database_id: Optional[str] = None
+_company_cache: Dict[str, str] = {}
+# A company's lock lives while any job holds or waits for it, so distinct
+# names don't accumulate locks for the life of the process
+_company_locks: Dict[str, asyncio.Lock] = {}
+_company_lock_users: Dict[str, int] = {}
+
+async def _get_company_database_id() -> Optional[str]:
+    """Resolve the Company relation's database ID once"""
+    global _company_database_id
+    if _company_database_id is None:
+        database_info = await notion_client.databases.retrieve(database_id=NOTION_DATABASE_ID)
+        _company_database_id = get_company_database_id(database_info)
+    return _company_database_id
+
+async def find_or_create_company_working(company_name: str) -> Optional[str]:
+    """Find existing company or create new one, one lookup per company at a time"""
+    if not company_name or company_name.strip() == "":
+        return None
+
+    cache_key = company_name.strip().casefold()
+    if cache_key in _company_cache:
+        logger.info(f"Using cached company: {company_name}")
+        return _company_cache[cache_key]
 
-        company_database_id = company_prop.get('relation', {}).get('database_id')
+    # Concurrent jobs for the same company must not both create it
+    lock = _company_locks.setdefault(cache_key, asyncio.Lock())
+    _company_lock_users[cache_key] = _company_lock_users.get(cache_key, 0) + 1
+    try:
+        async with lock:
+            if cache_key in _company_cache:
+                return _company_cache[cache_key]
+            return await _lookup_or_create_company(company_name, cache_key)
+    finally:
+        _company_lock_users[cache_key] -= 1
+        if not _company_lock_users[cache_key]:
+            del _company_lock_users[cache_key]
+            del _company_locks[cache_key]
+
+async def _lookup_or_create_company(company_name: str, cache_key: str) -> Optional[str]:
+    try:
+        company_database_id = await _get_company_database_id()
         if not company_database_id:
-            logger.warning("Could not find Company database ID")
             return None
 
         # Search for existing company
-        search_results = notion_client.databases.query(
+        search_results = await notion_client.databases.query(
             database_id=company_database_id,
-            filter={
-                "property": "Name",
-                "title": {
-                    "equals": company_name.strip()
-                }
-            }
+            filter=company_name_filter(company_name)
         )
 
         if search_results.get("results"):
             company_id = search_results["results"][0]["id"]
             logger.info(f"Found existing company: {company_name}")
+            _company_cache[cache_key] = company_id
             return company_id
 
         # Create new company
-        new_company = notion_client.pages.create(
+        new_company = await notion_client.pages.create(
             parent={"database_id": company_database_id},
             properties={
                 "Name": {"title": [{"text": {"content": company_name.strip()}}]}
@@ -548,6 +679,7 @@ def find_or_create_company_working(company_name: str) -> Optional[str]:
 
         company_id = new_company["id"]
         logger.info(f"Created new company: {company_name}")
+        _company_cache[cache_key] = company_id
         return company_id
 
     except Exception as e:
@@ -558,22 +690,47 @@ def find_or_create_company_working(company_name: str) -> Optional[str]:
 # Slack Helper Functions
 # -----------------------------
 
+# Slack allows roughly one message per second per channel; posts are
+# spaced out per channel rather than tripping 429s mid-batch
+SLACK_CHANNEL_INTERVAL = 1.0  # seconds
+_channel_next_slot: Dict[Optional[str], float] = {}
+_channel_locks: Dict[Optional[str], asyncio.Lock] = {}
+
+async def _wait_for_channel_slot(channel: Optional[str]):
+    lock = _channel_locks.setdefault(channel, asyncio.Lock())
+    async with lock:
+        delay = _channel_next_slot.get(channel, 0.0) - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        _channel_next_slot[channel] = time.monotonic() + SLACK_CHANNEL_INTERVAL
+
+async def slack_call(method, **kwargs):
+    """Call a Slack Web API method, throttled per channel and retried once if rate limited"""
+    await _wait_for_channel_slot(kwargs.get("channel"))
+    try:
+        return await method(**kwargs)
+    except SlackApiError as e:
+        if e.response.get("error") != "ratelimited":
+            raise
+        delay = int(e.response.headers.get("Retry-After", 1))
+        logger.warning(f"Slack rate limited on {kwargs.get('channel')}, retrying in {delay}s")
+        await asyncio.sleep(delay)
+        return await method(**kwargs)
+
 def extract_urls_from_text(text: str) -> list:
-    """Extract URLs from text"""
-    return URL_PATTERN.findall(text)
+    """Extract distinct URLs from text, minus sentence punctuation glued to the end"""
+    # dict.fromkeys drops repeats of the same link while keeping paste order
+    return list(dict.fromkeys(url.rstrip(URL_TRAILING_PUNCTUATION) for url in URL_PATTERN.findall(text)))
 
 def is_job_url(url: str) -> bool:
     """Check if URL looks like a job posting"""
-    job_keywords = [
-        'job', 'career', 'position', 'hiring', 'vacancy', 'employment',
-        'opportunities', 'roles', 'apply', 'jobs', 'careers', 'work', 'posting'
-    ]
-    return any(keyword in url.lower() for keyword in job_keywords)
+    return JOB_URL_PATTERN.search(url) is not None
 
 async def send_processing_message(client, channel: str, thread_ts: Optional[str] = None) -> Optional[str]:
     """Send processing message and return message timestamp"""
     try:
-        response = await client.chat_postMessage(
+        response = await slack_call(
+            client.chat_postMessage,
             channel=channel,
             thread_ts=thread_ts,
             text="🔍 Processing job posting... This may take a moment!",
@@ -651,7 +808,7 @@ async def update_message_with_result(client, channel: str, ts: str, success: boo
                 }
             ]
 
-        await client.chat_update(channel=channel, ts=ts, blocks=blocks)
+        await slack_call(client.chat_update, channel=channel, ts=ts, blocks=blocks)
 
     except Exception as e:
         logger.error(f"Error updating message: {e}")
@@ -663,55 +820,13 @@ async def process_job_url_safe(url: str, client, channel: str, thread_ts: Option
     try:
         # Send processing message
         processing_ts = await send_processing_message(client, channel, thread_ts)
-        logger.info(f"Processing job URL: {url}")
-
-        # Fetch job content
-        job_text = fetch_job_text(url)
-        if not job_text:
-            await update_message_with_result(
-                client, channel, processing_ts, False,
-                error_msg="Could not fetch job content. The page might be protected or inaccessible."
-            )
-            return
 
-        logger.info(f"Fetched {len(job_text)} characters from {url}")
-
-        # Extract fields
-        fields = extract_fields_robust(job_text)
-        logger.info(f"Extracted fields:")
-        logger.info(f"  Position: {fields.get('Position', 'Not found')}")
-        logger.info(f"  Company: {fields.get('Company', 'Not found')}")
-        logger.info(f"  Salary: {fields.get('Salary', 'Not found')}")
-        logger.info(f"  Location: {fields.get('Location', [])}")
-        logger.info(f"  Commitment: {fields.get('Commitment', 'Not found')}")
-        logger.info(f"  Industry: {fields.get('Industry', [])}")
-
-        # Create Notion page
-        new_page = create_notion_page_robust(fields, url, job_text)
-
-        if new_page:
-            # Success! Extract company name for display
-            company_name = fields.get('Company', '').strip()
-            if not company_name:
-                company_name = 'Company not specified'
-
-            result_data = {
-                'position': fields.get('Position', 'Position not specified'),
-                'company': company_name,
-                'salary': fields.get('Salary', 'Not specified'),
-                'location': fields.get('Location', []) if fields.get('Location') else ['Not specified'],
-                'commitment': fields.get('Commitment', 'Not specified'),
-                'industry': fields.get('Industry', []) if fields.get('Industry') else ['Not specified'],
-                'notion_url': new_page.get('url')
-            }
+        result = await get_job_result(url)
 
-            await update_message_with_result(client, channel, processing_ts, True, result_data)
-            logger.info(f"Successfully processed {url} - Created page for {result_data['position']} at {result_data['company']}")
+        if result['success']:
+            await update_message_with_result(client, channel, processing_ts, True, result['result_data'])
         else:
-            await update_message_with_result(
-                client, channel, processing_ts, False,
-                error_msg="Failed to create Notion page. Please check your database configuration."
-            )
+            await update_message_with_result(client, channel, processing_ts, False, error_msg=result['error'])
 
     except Exception as e:
         logger.error(f"Unexpected error processing {url}: {e}")
@@ -721,13 +836,204 @@ async def process_job_url_safe(url: str, client, channel: str, thread_ts: Option
                 error_msg=f"Unexpected error: {str(e)[:100]}..."
             )
 
+async def process_job_urls(urls: list, client, channel: str, thread_ts: Optional[str] = None):
+    """Process several job URLs concurrently, reporting a batch through coalesced status lines"""
+    if not urls:
+        return
+    if len(urls) == 1:
+        await process_job_url_safe(urls[0], client, channel, thread_ts)
+        return
+
+    # One immediate message for the whole batch instead of one per URL
+    try:
+        await slack_call(
+            client.chat_postMessage,
+            channel=channel,
+            thread_ts=thread_ts,
+            text=f"🔍 Processing {len(urls)} job postings... Results will follow as they finish."
+        )
+    except Exception as e:
+        logger.error(f"Error sending batch processing message: {e}")
+
+    await asyncio.gather(
+        *(_queue_job_status(url, channel, thread_ts) for url in urls),
+        return_exceptions=True
+    )
+
+async def _queue_job_status(url: str, channel: str, thread_ts: Optional[str]):
+    # One URL failing must not hide the others' results
+    try:
+        result = await get_job_result(url)
+    except Exception as e:
+        logger.error(f"Error processing {url}: {e}")
+        result = {'success': False, 'error': str(e)[:100]}
+
+    if result['success']:
+        data = result['result_data']
+        line = f"✅ *{data['position']}* at {data['company']}"
+        if data.get('notion_url'):
+            line += f" – <{data['notion_url']}|View in Notion>"
+    else:
+        line = f"❌ `{url}`: {result['error']}"
+    queue_status(channel, thread_ts, line)
+
+# Status lines from a batch are buffered per channel/thread and posted as a
+# single message each second, so a 10-URL paste is one post, not ten
+STATUS_FLUSH_INTERVAL = 1.0  # seconds
+_pending_status: Dict[Tuple[str, Optional[str]], List[str]] = defaultdict(list)
+
+def queue_status(channel: str, thread_ts: Optional[str], line: str):
+    """Buffer a status line for the next consolidated post"""
+    _pending_status[(channel, thread_ts)].append(line)
+
+async def flush_status_messages(client):
+    """Post buffered status lines, one message per channel/thread, every second"""
+    while True:
+        await asyncio.sleep(STATUS_FLUSH_INTERVAL)
+        for key in list(_pending_status):
+            lines = _pending_status.pop(key)
+            channel, thread_ts = key
+            try:
+                await slack_call(
+                    client.chat_postMessage,
+                    channel=channel,
+                    thread_ts=thread_ts,
+                    text="\n".join(lines)
+                )
+            except Exception as e:
+                logger.error(f"Error posting status update to {channel}: {e}")
+
+# A successfully finished job stays registered for a while so Slack's event
+# retries and repeat posts of the same URL reuse its result instead of
+# creating a second Notion page; failed jobs are dropped so a retry runs
+INFLIGHT_RESULT_TTL = 60  # seconds
+
+# Hard cap on one job so a stalled site, OpenAI or Notion call frees its
+# semaphore slot and connections; covers the Playwright + httpx fetch
+# attempts plus extraction and page creation
+JOB_TIMEOUT = 90  # seconds
+_inflight_jobs: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+async def get_job_result(url: str) -> Dict[str, Any]:
+    """Run the job for a URL, sharing one run between duplicate submissions"""
+    key = url.strip()
+    task = _inflight_jobs.get(key)
+
+    if task is None:
+        task = asyncio.create_task(_run_job(url))
+        _inflight_jobs[key] = task
+        task.add_done_callback(lambda done: _release_inflight_job(key, done))
+    else:
+        logger.info(f"Reusing in-flight job for {url}")
+
+    # Shielded so one Slack handler giving up doesn't cancel the shared job
+    return await asyncio.shield(task)
+
+def _release_inflight_job(key: str, task: "asyncio.Task[Dict[str, Any]]"):
+    """Keep successful results around for the TTL; forget failures at once so a retry runs again"""
+    if not task.cancelled() and task.exception() is None and task.result().get('success'):
+        task.get_loop().call_later(INFLIGHT_RESULT_TTL, _inflight_jobs.pop, key, None)
+    elif _inflight_jobs.get(key) is task:
+        del _inflight_jobs[key]
+
+async def _run_job(url: str) -> Dict[str, Any]:
+    """Fetch, extract and store a job posting, bounded by job_semaphore"""
+    async with job_semaphore:
+        try:
+            return await asyncio.wait_for(_run_job_unbounded(url), JOB_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out after {JOB_TIMEOUT}s processing {url}")
+            return {'success': False, 'error': f"Timed out after {JOB_TIMEOUT} seconds. The site or an API was too slow, please try again."}
+        except Exception as e:
+            logger.error(f"Unexpected error processing {url}: {e}")
+            return {'success': False, 'error': f"Unexpected error: {str(e)[:100]}..."}
+
+async def _run_job_unbounded(url: str) -> Dict[str, Any]:
+    logger.info(f"Processing job URL: {url}")
+
+    # Fetch job content
+    job_text = await fetch_job_text(url)
+    if not job_text:
+        return {
+            'success': False,
+            'error': "Could not fetch job content. The page might be protected or inaccessible."
+        }
+
+    logger.info(f"Fetched {len(job_text)} characters from {url}")
+
+    # Prompts only use the first 8000 characters and the Notion toggle keeps
+    # DESCRIPTION_MAX_CHARS, so don't hold whole pages for every in-flight
+    # job. One extra character is kept so build_notion_page_request can
+    # still tell the text was cut and add the truncation note.
+    job_text = job_text[:DESCRIPTION_MAX_CHARS + 1]
+
+    # Extract fields, including the summary
+    fields = await extract_fields_robust(job_text)
+    logger.info(f"Extracted fields:")
+    logger.info(f"  Position: {fields.get('Position', 'Not found')}")
+    logger.info(f"  Company: {fields.get('Company', 'Not found')}")
+    logger.info(f"  Salary: {fields.get('Salary', 'Not found')}")
+    logger.info(f"  Location: {fields.get('Location', [])}")
+    logger.info(f"  Commitment: {fields.get('Commitment', 'Not found')}")
+    logger.info(f"  Industry: {fields.get('Industry', [])}")
+
+    # Find or create the company
+    company_id = await find_or_create_company_working(fields.get("Company", ""))
+
+    # Create Notion page
+    summary = fields.get("Summary") or "Job summary not available"
+    new_page = await create_notion_page_robust(fields, url, job_text, summary, company_id)
+
+    if not new_page:
+        return {
+            'success': False,
+            'error': "Failed to create Notion page. Please check your database configuration."
+        }
+
+    # Success! Extract company name for display
+    company_name = fields.get('Company', '').strip()
+    if not company_name:
+        company_name = 'Company not specified'
+
+    result_data = {
+        'position': fields.get('Position', 'Position not specified'),
+        'company': company_name,
+        'salary': fields.get('Salary', 'Not specified'),
+        'location': fields.get('Location', []) if fields.get('Location') else ['Not specified'],
+        'commitment': fields.get('Commitment', 'Not specified'),
+        'industry': fields.get('Industry', []) if fields.get('Industry') else ['Not specified'],
+        'notion_url': new_page.get('url')
+    }
+
+    logger.info(f"Successfully processed {url} - Created page for {result_data['position']} at {result_data['company']}")
+    return {'success': True, 'result_data': result_data}
+
 # -----------------------------
 # Slack Event Handlers
 # -----------------------------
 
+# Strong references to background jobs so they aren't garbage collected
+# before they finish
+_background_tasks: set = set()
+
+def _log_background_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Background job failed: {task.exception()}")
+
+def run_in_background(coro):
+    """Schedule a coroutine without making the Slack handler wait for it"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    task.add_done_callback(_log_background_failure)
+    return task
+
 @app.event("app_mention")
-async def handle_app_mention(event, client):
+async def handle_app_mention(event, client, ack):
     """Handle @jobbot mentions with robust error handling"""
+    # Ack inside Slack's 3 second window so the event isn't redelivered
+    await ack()
+
     try:
         channel = event['channel']
         text = event.get('text', '')
@@ -739,28 +1045,34 @@ async def handle_app_mention(event, client):
         urls = extract_urls_from_text(text)
 
         if not urls:
-            await client.chat_postMessage(
+            await slack_call(
+                client.chat_postMessage,
                 channel=channel,
                 thread_ts=thread_ts,
                 text="👋 Hi! I can help you add job postings to Notion. Just mention me with a job URL:\n`@jobbot https://example.com/job-posting`"
             )
             return
 
-        # Process each URL
+        job_urls = []
         for url in urls:
             if is_job_url(url):
-                await process_job_url_safe(url, client, channel, thread_ts)
+                job_urls.append(url)
             else:
-                await client.chat_postMessage(
+                await slack_call(
+                    client.chat_postMessage,
                     channel=channel,
                     thread_ts=thread_ts,
                     text=f"🤔 That doesn't look like a job posting URL. I work best with job/career pages:\n`{url}`"
                 )
 
+        # Process all job URLs concurrently in the background
+        run_in_background(process_job_urls(job_urls, client, channel, thread_ts))
+
     except Exception as e:
         logger.error(f"Error in app_mention handler: {e}")
         try:
-            await client.chat_postMessage(
+            await slack_call(
+                client.chat_postMessage,
                 channel=event.get('channel'),
                 text="❌ Sorry, I encountered an error processing your request. Please try again."
             )
@@ -768,8 +1080,11 @@ async def handle_app_mention(event, client):
             pass  # Don't fail if we can't even send error message
 
 @app.event("message")
-async def handle_message(event, client):
+async def handle_message(event, client, ack):
     """Handle direct messages with robust error handling"""
+    # Ack inside Slack's 3 second window so the event isn't redelivered
+    await ack()
+
     try:
         # Only process direct messages
         if event.get('channel_type') != 'im':
@@ -788,20 +1103,21 @@ async def handle_message(event, client):
         urls = extract_urls_from_text(text)
 
         if not urls:
-            await client.chat_postMessage(
+            await slack_call(
+                client.chat_postMessage,
                 channel=channel,
                 text="👋 Hi! Send me a job posting URL and I'll extract the information and add it to your Notion database.\n\nExample: `https://example.com/job-posting`"
             )
             return
 
-        # Process each URL
-        for url in urls:
-            await process_job_url_safe(url, client, channel)
+        # Process all URLs concurrently in the background
+        run_in_background(process_job_urls(urls, client, channel))
 
     except Exception as e:
         logger.error(f"Error in message handler: {e}")
         try:
-            await client.chat_postMessage(
+            await slack_call(
+                client.chat_postMessage,
                 channel=event.get('channel'),
                 text="❌ Sorry, I encountered an error processing your message. Please try again."
             )
@@ -821,7 +1137,8 @@ async def handle_addjob_command(ack, command, client):
         logger.info(f"Slash command from user {user}: {text}")
 
         if not text:
-            await client.chat_postEphemeral(
+            await slack_call(
+                client.chat_postEphemeral,
                 channel=channel,
                 user=user,
                 text="Please provide a job URL: `/addjob https://example.com/job-posting`"
@@ -830,20 +1147,22 @@ async def handle_addjob_command(ack, command, client):
 
         urls = extract_urls_from_text(text)
         if not urls:
-            await client.chat_postEphemeral(
+            await slack_call(
+                client.chat_postEphemeral,
                 channel=channel,
                 user=user,
                 text="Please provide a valid URL: `/addjob https://example.com/job-posting`"
             )
             return
 
-        # Process the first URL
-        await process_job_url_safe(urls[0], client, channel)
+        # Process the first URL in the background; the command is already acked
+        run_in_background(process_job_url_safe(urls[0], client, channel))
 
     except Exception as e:
         logger.error(f"Error in addjob command handler: {e}")
         try:
-            await client.chat_postEphemeral(
+            await slack_call(
+                client.chat_postEphemeral,
                 channel=command.get('channel_id'),
                 user=command.get('user_id'),
                 text="❌ Sorry, I encountered an error processing your command. Please try again."
@@ -855,7 +1174,7 @@ async def handle_addjob_command(ack, command, client):
 async def handle_errors(error, body, logger_slack):
     """Global error handler"""
     logger.error(f"Slack app error: {error}")
-    logger.error(f"Request body: {json.dumps(body, indent=2, default=str)}")
+    logger.error(f"Request body: {json.dumps(body, separators=(',', ':'), default=str)}")
 
 # -----------------------------
 # Main Function
@@ -863,6 +1182,18 @@ async def handle_errors(error, body, logger_slack):
 
 async def main():
     """Start the Slack bot with comprehensive error handling"""
+    global job_semaphore, http_client
+    job_semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+    http_client = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=HTTP_LIMITS,
+        timeout=15.0,
+        follow_redirects=True,
+        headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    )
+
+    status_task = asyncio.create_task(flush_status_messages(app.client))
+
     try:
         handler = AsyncSocketModeHandler(app, SLACK_APP_TOKEN)
 
@@ -885,11 +1216,15 @@ async def main():
     except Exception as e:
         logger.error(f"Failed to start Slack bot: {e}")
         raise
+    finally:
+        status_task.cancel()
+        await http_client.aclose()
+        await close_browser()
 
 if __name__ == "__main__":
     print("🚀 Starting JobBot Slack Integration (Fixed Version)...")
     print("\n✨ Key improvements:")
-    print("• Robust JSON parsing with multiple fallback strategies")
+    print("• Reliable JSON extraction via OpenAI JSON mode")
     print("• Proper text length handling for Notion API")
     print("• Comprehensive error handling in all event handlers")
     print("• Better logging and debugging")
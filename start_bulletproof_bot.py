@@ -8,6 +8,7 @@ import os
 import sys
 import time
 import signal
+import threading
 import subprocess
 import logging
 from pathlib import Path
@@ -24,71 +25,107 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+REQUIRED_ENV_VARS = ('SLACK_BOT_TOKEN', 'SLACK_APP_TOKEN')
+OPTIONAL_ENV_VARS = {
+    'OPENAI_API_KEY': 'AI processing',
+    'NOTION_TOKEN': 'Notion integration',
+    'NOTION_DATABASE_ID': 'Notion database'
+}
+
+# Seconds a process group gets to exit after SIGTERM before SIGKILL
+STOP_TIMEOUT = 10
+
 class BulletproofBotManager:
     """Master manager for the bulletproof bot system"""
 
+    # Fixed attribute set: no per-instance __dict__, and a misspelt
+    # attribute assignment raises instead of silently creating a new one
+    __slots__ = (
+        'script_dir', 'venv_python', 'bot_script', 'watchdog_script',
+        'venv_python_found', 'bot_script_found', '_env_ok',
+        'bot_process', 'watchdog_process', 'running',
+        'child_exited', 'log_handles'
+    )
+
     def __init__(self):
         self.script_dir = Path(__file__).parent
         self.venv_python = self.script_dir / "venv" / "bin" / "python3"
         self.bot_script = self.script_dir / "slack_bot_bulletproof.py"
         self.watchdog_script = self.script_dir / "bot_watchdog.py"
 
+        # Stat the filesystem once; the result of check_environment is cached too
+        self.venv_python_found = self.venv_python.is_file()
+        self.bot_script_found = self.bot_script.is_file()
+        self._env_ok = None
+
         self.bot_process = None
         self.watchdog_process = None
         self.running = False
 
+        # Set by per-child waiter threads as soon as any child exits
+        self.child_exited = threading.Event()
+
+        # Child stdout/stderr go to files; undrained pipes fill up and stall the child
+        self.log_handles = []
+
     def check_environment(self):
         """Verify all requirements are met"""
+        if self._env_ok is not None:
+            return self._env_ok
+
         logger.info("Checking environment...")
 
         issues = []
 
         # Check Python virtual environment
-        if not self.venv_python.exists():
+        if not self.venv_python_found:
             issues.append(f"Virtual environment Python not found: {self.venv_python}")
 
         # Check bot script
-        if not self.bot_script.exists():
+        if not self.bot_script_found:
             issues.append(f"Bot script not found: {self.bot_script}")
 
         # Check environment variables
-        required_vars = ['SLACK_BOT_TOKEN', 'SLACK_APP_TOKEN']
-        for var in required_vars:
-            if not os.getenv(var):
-                issues.append(f"Missing required environment variable: {var}")
+        missing = [var for var in REQUIRED_ENV_VARS if not os.environ.get(var)]
+        issues.extend(f"Missing required environment variable: {var}" for var in missing)
 
         # Check optional services
-        optional_vars = {
-            'OPENAI_API_KEY': 'AI processing',
-            'NOTION_TOKEN': 'Notion integration',
-            'NOTION_DATABASE_ID': 'Notion database'
-        }
-
-        for var, service in optional_vars.items():
-            if not os.getenv(var):
+        for var, service in OPTIONAL_ENV_VARS.items():
+            if not os.environ.get(var):
                 logger.warning(f"Optional service disabled - missing {var}: {service}")
 
         if issues:
             logger.error("Environment check failed:")
             for issue in issues:
                 logger.error(f"  - {issue}")
+            self._env_ok = False
             return False
 
         logger.info("Environment check passed ✓")
+        self._env_ok = True
         return True
 
+    def open_child_logs(self, name):
+        """Open unbuffered append-mode stdout/stderr log files for a child process"""
+        out = open(self.script_dir / f"{name}.out.log", "ab", buffering=0)
+        err = open(self.script_dir / f"{name}.err.log", "ab", buffering=0)
+        self.log_handles.extend([out, err])
+        return out, err
+
     def start_bot_direct(self):
         """Start the bot directly (for testing)"""
         try:
             logger.info("Starting bulletproof bot directly...")
 
             cmd = [str(self.venv_python), str(self.bot_script)]
+            out, err = self.open_child_logs("bot")
 
             self.bot_process = subprocess.Popen(
                 cmd,
                 cwd=str(self.script_dir),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stdout=out,
+                stderr=err,
+                start_new_session=True
             )
 
             logger.info(f"Bot started with PID: {self.bot_process.pid}")
@@ -98,18 +135,39 @@ class BulletproofBotManager:
             logger.error(f"Failed to start bot: {e}")
             return False
 
+    def exec_bot_direct(self):
+        """Replace this process with the bot (direct mode has nothing else to do)"""
+        logger.info("Handing over to bulletproof bot via exec...")
+
+        # Nothing below survives exec: flush our log and close any child log files
+        for handle in self.log_handles:
+            handle.close()
+        self.log_handles = []
+        for handler in logging.getLogger().handlers:
+            handler.flush()
+
+        try:
+            os.chdir(self.script_dir)
+            os.execv(str(self.venv_python), [str(self.venv_python), str(self.bot_script)])
+        except OSError as e:
+            # Logging is still live here, so this reaches stderr and the log file
+            logger.error(f"Failed to exec bot with {self.venv_python}: {e}")
+            return 1
+
     def start_with_watchdog(self):
         """Start bot with watchdog monitoring"""
         try:
             logger.info("Starting bot with watchdog monitoring...")
 
             cmd = [str(self.venv_python), str(self.watchdog_script)]
+            out, err = self.open_child_logs("watchdog")
 
             self.watchdog_process = subprocess.Popen(
                 cmd,
                 cwd=str(self.script_dir),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stdout=out,
+                stderr=err,
+                start_new_session=True
             )
 
             logger.info(f"Watchdog started with PID: {self.watchdog_process.pid}")
@@ -119,51 +177,91 @@ class BulletproofBotManager:
             logger.error(f"Failed to start watchdog: {e}")
             return False
 
+    def signal_group(self, process, sig):
+        """Signal a child's whole process group, so the bot the watchdog spawned goes too"""
+        # Each child leads its own session, so its PID is the group ID, and
+        # the group outlives the leader while anything it spawned is running
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def group_alive(self, process):
+        """Whether any process, leader or descendant, is left in a child's group"""
+        process.poll()  # reap the leader so a zombie doesn't count
+        try:
+            os.killpg(process.pid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+
     def stop_all(self):
         """Stop all processes"""
         logger.info("Stopping all processes...")
+        self.running = False
 
         processes = [
-            ("bot", self.bot_process),
-            ("watchdog", self.watchdog_process)
+            (name, process)
+            for name, process in (("bot", self.bot_process), ("watchdog", self.watchdog_process))
+            if process
         ]
 
+        # Signal every group even if its leader already exited: a dead
+        # watchdog can leave the bot it spawned behind in its group
         for name, process in processes:
-            if process and process.poll() is None:
-                try:
-                    logger.info(f"Stopping {name} process (PID: {process.pid})")
-                    process.terminate()
-                    process.wait(timeout=10)
-                    logger.info(f"{name} stopped gracefully")
-                except subprocess.TimeoutExpired:
-                    logger.warning(f"{name} didn't stop gracefully, killing...")
-                    process.kill()
-                    process.wait()
-                except Exception as e:
-                    logger.error(f"Error stopping {name}: {e}")
+            logger.info(f"Stopping {name} process group (PID: {process.pid})")
+            self.signal_group(process, signal.SIGTERM)
+
+        deadline = time.monotonic() + STOP_TIMEOUT
+        remaining = [(name, process) for name, process in processes if self.group_alive(process)]
+        while remaining and time.monotonic() < deadline:
+            time.sleep(0.2)
+            remaining = [(name, process) for name, process in remaining if self.group_alive(process)]
+
+        for name, process in remaining:
+            logger.warning(f"{name} didn't stop gracefully, killing...")
+            self.signal_group(process, signal.SIGKILL)
+            try:
+                process.wait(timeout=STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                logger.error(f"{name} (PID: {process.pid}) did not exit after SIGKILL")
 
-        self.running = False
+        for handle in self.log_handles:
+            handle.close()
+        self.log_handles = []
+
+    def wait_for_exit(self, name, process):
+        """Block until a child exits, then wake the monitor"""
+        returncode = process.wait()
+        if self.running:
+            logger.error(f"{name} process died with exit code: {returncode}")
+        self.child_exited.set()
 
     def monitor_processes(self):
         """Monitor running processes"""
         logger.info("Starting process monitor...")
         self.running = True
+        self.child_exited.clear()
 
-        try:
-            while self.running:
-                # Check bot process
-                if self.bot_process and self.bot_process.poll() is not None:
-                    logger.error(f"Bot process died with exit code: {self.bot_process.returncode}")
-                    self.running = False
-                    break
+        processes = [
+            ("Bot", self.bot_process),
+            ("Watchdog", self.watchdog_process)
+        ]
 
-                # Check watchdog process
-                if self.watchdog_process and self.watchdog_process.poll() is not None:
-                    logger.error(f"Watchdog process died with exit code: {self.watchdog_process.returncode}")
-                    self.running = False
-                    break
+        for name, process in processes:
+            if process:
+                threading.Thread(
+                    target=self.wait_for_exit,
+                    args=(name, process),
+                    daemon=True
+                ).start()
 
-                time.sleep(5)
+        try:
+            # Timeout only keeps the main thread responsive to Ctrl+C
+            while self.running and not self.child_exited.wait(timeout=60):
+                pass
 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
@@ -266,12 +364,10 @@ def main():
         if mode == "production" or mode == "prod":
             return manager.run_production_mode()
         elif mode == "direct":
-            if manager.check_environment() and manager.start_bot_direct():
-                logger.info("Direct mode started. Press Ctrl+C to stop.")
-                manager.monitor_processes()
-                return 0
-            else:
+            if not manager.check_environment():
                 return 1
+            # Only returns if the exec failed
+            return manager.exec_bot_direct()
         elif mode == "check":
             return 0 if manager.check_environment() else 1
         else:
@@ -8,6 +8,7 @@ import os
 import sys
 import subprocess
 import time
+from importlib.util import find_spec
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -45,18 +46,20 @@ def check_environment():
 
 def check_dependencies():
     """Check if required packages are installed"""
-    try:
-        import slack_bolt
-        import openai
-        import notion_client
-        return True
-    except ImportError as e:
+    # find_spec only locates the package without running its import-time code
+    missing = [package for package in ('slack_bolt', 'openai', 'notion_client')
+               if find_spec(package) is None]
+
+    if missing:
         print("❌ Missing required packages:")
-        print(f"   {e}")
+        for package in missing:
+            print(f"   - {package}")
         print("\nInstall dependencies with:")
         print("   pip install -r requirements.txt")
         return False
 
+    return True
+
 def start_bot():
     """Start the Slack bot"""
     try:
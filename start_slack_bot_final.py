@@ -14,6 +14,7 @@ import os
 import sys
 import time
 import asyncio
+from importlib.util import find_spec
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -59,12 +60,9 @@ def check_dependencies():
         ('dotenv', 'Environment variables')
     ]
 
-    missing = []
-    for package, description in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing.append((package, description))
+    # find_spec only locates the package without running its import-time code
+    missing = [(package, description) for package, description in required_packages
+               if find_spec(package) is None]
 
     if missing:
         print("❌ Missing required packages:")
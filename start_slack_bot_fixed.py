@@ -8,6 +8,7 @@ import os
 import sys
 import subprocess
 import time
+from importlib.util import find_spec
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -45,20 +46,20 @@ def check_environment():
 
 def check_dependencies():
     """Check if required packages are installed"""
-    try:
-        import slack_bolt
-        import openai
-        import notion_client
-        import requests
-        import bs4
-        return True
-    except ImportError as e:
+    # Every missing package is reported at once, without importing any of them
+    missing = [package for package in ('slack_bolt', 'openai', 'notion_client', 'requests', 'bs4')
+               if find_spec(package) is None]
+
+    if missing:
         print("❌ Missing required packages:")
-        print(f"   {e}")
+        for package in missing:
+            print(f"   - {package}")
         print("\nInstall dependencies with:")
         print("   pip install -r requirements.txt")
         return False
 
+    return True
+
 def start_fixed_bot():
     """Start the fixed Slack bot"""
     try:
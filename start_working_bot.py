@@ -6,26 +6,76 @@ Starts the comprehensive working Slack bot that fixes all issues at once
 
 import os
 import sys
-import time
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
+import logging
+from functools import lru_cache
+from importlib.util import find_spec
+
+REQUIRED_ENV_VARS = (
+    'OPENAI_API_KEY',
+    'NOTION_TOKEN',
+    'NOTION_DATABASE_ID',
+    'SLACK_BOT_TOKEN',
+    'SLACK_APP_TOKEN'
+)
+REQUIRED_PACKAGES = ("slack_bolt", "openai", "notion_client", "requests", "bs4", "playwright")
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# The project's .env sits next to this script; naming it directly skips
+# dotenv's upward directory search
+ENV_FILE = os.path.join(SCRIPT_DIR, '.env')
+BOT_SCRIPT = os.path.join(SCRIPT_DIR, 'slack_bot_working.py')
+
+# Load environment variables, unless the real environment (launchd, a
+# container) already provides everything; slack_bot_working still reads
+# .env itself for its optional settings
+if not all(var in os.environ for var in REQUIRED_ENV_VARS):
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        # No python-dotenv: check_environment reports whatever is missing
+        dotenv_values = None
+
+    if dotenv_values is not None:
+        # Same semantics as load_dotenv(): real environment variables win
+        os.environ.update({
+            key: value for key, value in dotenv_values(ENV_FILE).items()
+            if value is not None and key not in os.environ
+        })
+
+logger = logging.getLogger("jobbot.startup")
+
+TROUBLESHOOTING = """Troubleshooting:
+1. Check your .env file has all required variables
+2. Verify Slack app configuration (Socket Mode enabled)
+3. Run 'python check_config.py' to verify connections
+4. Check slack_bot_working.log for detailed logs"""
+
+# Banners are built once at import and each written in a single call
+HEADER_BANNER = "🚀 JobBot - COMPREHENSIVE WORKING VERSION\n" + "=" * 50 + "\n"
+
+CHECKS_PASSED_BANNER = "\n".join([
+    "",
+    "🎯 All checks passed!",
+    "🔧 Starting COMPREHENSIVE WORKING VERSION...",
+    "",
+    "This version combines ALL fixes in one implementation:",
+    "• Fixes dispatch_failed errors",
+    "• Populates all Notion fields correctly",
+    "• Creates job description toggle blocks",
+    "• Links company relations properly",
+    "• Handles all multi-select fields",
+    "",
+    ""
+])
+
+# Both checks are computed once per process: the environment and installed
+# packages don't change while the launcher runs
+@lru_cache(maxsize=1)
 def check_environment():
     """Check if all required environment variables are set"""
-    required_vars = [
-        'OPENAI_API_KEY',
-        'NOTION_TOKEN',
-        'NOTION_DATABASE_ID',
-        'SLACK_BOT_TOKEN',
-        'SLACK_APP_TOKEN'
-    ]
-
-    missing = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing.append(var)
+    env = os.environ
+    missing = [var for var in REQUIRED_ENV_VARS if not env.get(var)]
 
     if missing:
         print("❌ Missing required environment variables:")
@@ -36,96 +86,62 @@ def check_environment():
 
     return True
 
+def is_installed(package):
+    """Check a package is importable without running its import-time code"""
+    try:
+        return find_spec(package) is not None
+    except (ImportError, ValueError):
+        # find_spec can fail on odd namespace packages; a real import settles it
+        try:
+            __import__(package)
+            return True
+        except ImportError:
+            return False
+
+@lru_cache(maxsize=1)
 def check_dependencies():
     """Check if required packages are installed"""
-    try:
-        import slack_bolt
-        import openai
-        import notion_client
-        import requests
-        import bs4
-        import playwright
-        return True
-    except ImportError as e:
-        print(f"❌ Missing required packages: {e}")
+    # Sequential on purpose: find_spec consults the finders under the global
+    # import lock, so a thread pool would only add start-up cost
+    missing = [package for package in REQUIRED_PACKAGES if not is_installed(package)]
+
+    if missing:
+        print(f"❌ Missing required packages: {', '.join(missing)}")
         print("\nInstall dependencies with:")
         print("   pip install -r requirements.txt")
         return False
 
+    return True
+
 def start_working_bot():
-    """Start the comprehensive working Slack bot"""
+    """Hand this process over to the comprehensive working Slack bot"""
+    # The launcher has nothing left to do once checks pass, so the bot
+    # replaces it instead of running inside it; the bot prints its own banner
+    sys.stdout.flush()
     try:
-        import asyncio
-        from slack_bot_working import main as bot_main
-
-        print("🤖 Starting JobBot - COMPREHENSIVE WORKING VERSION")
-        print("=" * 60)
-        print("\n🎉 THIS VERSION FIXES ALL ISSUES AT ONCE:")
-        print("")
-        print("✅ NO MORE DISPATCH_FAILED ERRORS")
-        print("   • Uses proven jobbot_cli functions")
-        print("   • Minimal async complexity")
-        print("   • Robust error handling")
-        print("")
-        print("✅ COMPLETE NOTION INTEGRATION")
-        print("   • Company name -> Company relation linking")
-        print("   • Salary field properly populated")
-        print("   • Location multi-select tags")
-        print("   • Industry multi-select tags")
-        print("   • Commitment multi-select handling")
-        print("   • Job Description toggle blocks with FULL content")
-        print("   • Status: 'Researching', Processed: False")
-        print("")
-        print("✅ ALL SLACK FEATURES WORKING")
-        print("   • Direct messages with job URLs")
-        print("   • @jobbot https://job-url.com in channels")
-        print("   • /addjob https://job-url.com slash command")
-        print("")
-        print("🚀 Bot starting... Send job URLs to test!")
-        print("-" * 60)
-
-        asyncio.run(bot_main())
-
-    except KeyboardInterrupt:
-        print("\n👋 JobBot stopped by user")
-        sys.exit(0)
-    except Exception as e:
-        print(f"❌ Error starting bot: {e}")
-        print("\nTroubleshooting:")
-        print("1. Check your .env file has all required variables")
-        print("2. Verify Slack app configuration (Socket Mode enabled)")
-        print("3. Run 'python check_config.py' to verify connections")
-        print("4. Check slack_bot_working.log for detailed logs")
-        sys.exit(1)
+        os.execv(sys.executable, [sys.executable, BOT_SCRIPT])
+    except OSError:
+        logger.exception(f"❌ Error starting bot\n{TROUBLESHOOTING}")
+        raise SystemExit(1)
 
-def main():
-    print("🚀 JobBot - COMPREHENSIVE WORKING VERSION")
-    print("=" * 50)
+# Pre-flight checks run in order: (progress line, success line, check)
+PREFLIGHT_CHECKS = (
+    ("🔍 Checking environment variables...", "✅ Environment variables OK", check_environment),
+    ("\n📦 Checking dependencies...", "✅ Dependencies OK", check_dependencies),
+)
 
-    # Check environment
-    print("🔍 Checking environment variables...")
-    if not check_environment():
-        sys.exit(1)
-    print("✅ Environment variables OK")
+def main():
+    sys.stdout.write(HEADER_BANNER)
 
-    # Check dependencies
-    print("\n📦 Checking dependencies...")
-    if not check_dependencies():
-        sys.exit(1)
-    print("✅ Dependencies OK")
+    for progress, success, check in PREFLIGHT_CHECKS:
+        print(progress)
+        if not check():
+            raise SystemExit(1)
+        print(success)
 
     # Start bot
-    print("\n🎯 All checks passed!")
-    print("🔧 Starting COMPREHENSIVE WORKING VERSION...")
-    print("")
-    print("This version combines ALL fixes in one implementation:")
-    print("• Fixes dispatch_failed errors")
-    print("• Populates all Notion fields correctly")
-    print("• Creates job description toggle blocks")
-    print("• Links company relations properly")
-    print("• Handles all multi-select fields")
-    print("")
-    time.sleep(2)
+    sys.stdout.write(CHECKS_PASSED_BANNER)
+    sys.stdout.flush()
 
     start_working_bot()
 